@@ -1,17 +1,66 @@
 """Analyze: Interactive analysis of cleaned data with dynamic axis limits."""
 
 import json
+import zipfile
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
-import matplotlib.pyplot as plt
-from matplotlib.widgets import Button, TextBox
 import numpy as np
 
+from smva.utils.downsample import minmax_lttb_union_indices
+from smva.utils.jsonio import load_json
+
+# Parsed cleaned data keyed by (resolved path, mtime in ns, size in bytes)
+_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+
+# Figure layout, [left, bottom, width, height] in figure coordinates
+PLOT_RECT = (0.12, 0.12, 0.75, 0.75)
+RESET_BUTTON_RECT = (0.02, 0.92, 0.08, 0.04)
+TEXTBOX_WIDTH = 0.08
+TEXTBOX_HEIGHT = 0.035
+
+
+@dataclass(frozen=True)
+class LimitTextBoxSpec:
+    """Axis limit field: limit key, label, textbox position and decimal places."""
+
+    key: str
+    label: str
+    left: float
+    bottom: float
+    decimals: int
+
+    @property
+    def fmt(self) -> str:
+        """Format spec for the limit value."""
+        return f".{self.decimals}f"
+
+
+# Shared by both plotting backends; positions are only used by matplotlib
+# Time: below X-axis, at bottom
+# Current: left side, voltage: right side (min at bottom, max at top)
+LIMIT_TEXTBOXES = (
+    LimitTextBoxSpec('time_min', 'Time min (s)', 0.12, 0.02, 1),
+    LimitTextBoxSpec('time_max', 'Time max (s)', 0.79 - TEXTBOX_WIDTH, 0.02, 1),
+    LimitTextBoxSpec('current_min', 'Current min (A)', 0.02, 0.12, 1),
+    LimitTextBoxSpec('current_max', 'Current max (A)', 0.02, 0.87, 1),
+    LimitTextBoxSpec('voltage_min', 'Voltage min (V)', 0.90, 0.12, 2),
+    LimitTextBoxSpec('voltage_max', 'Voltage max (V)', 0.90, 0.87, 2),
+)
+
 
 def load_cleaned_data(cleaned_path: Path) -> Dict[str, Any]:
     """
     Load cleaned data from JSON file.
+    Results are cached per process and reused while the file is unchanged.
+    The series array built by build_series_array is stored under "_series".
+    A binary .npz sidecar is written next to the JSON file and used instead
+    of parsing the JSON on later runs while the JSON file keeps the same
+    mtime and size; data loaded from the sidecar contains the file metadata
+    and "_series" but no per-point "data" list.
 
     Args:
         cleaned_path: Path to cleaned JSON file
@@ -22,109 +71,297 @@ def load_cleaned_data(cleaned_path: Path) -> Dict[str, Any]:
     if not cleaned_path.exists():
         raise FileNotFoundError(f"Cleaned data file not found: {cleaned_path}")
 
-    with open(cleaned_path, "r") as f:
-        data = json.load(f)
+    stat = cleaned_path.stat()
+    key = (str(cleaned_path.resolve()), stat.st_mtime_ns, stat.st_size)
+    if key in _CACHE:
+        return _CACHE[key]
+
+    sidecar_path = cleaned_path.with_suffix(".npz")
+    source = (stat.st_mtime_ns, stat.st_size)
+    data = load_series_sidecar(sidecar_path, source) if sidecar_path.exists() else None
+    if data is None:
+        data = load_json(cleaned_path)
+
+        if "data" not in data:
+            raise ValueError("Invalid cleaned data file format: missing 'data' key")
+
+        data["_series"] = build_series_array(data["data"])
+        save_series_sidecar(sidecar_path, data, source)
 
-    if "data" not in data:
-        raise ValueError("Invalid cleaned data file format: missing 'data' key")
+    _CACHE[key] = data
 
     return data
 
 
-def plot_interactive(data: Dict[str, Any]) -> None:
+def save_series_sidecar(
+    sidecar_path: Path, data: Dict[str, Any], source: Tuple[int, int]
+) -> None:
     """
-    Create interactive plot with dynamic axis limits.
+    Save series array and file metadata to a .npz sidecar.
+    The sidecar is only a cache, so write errors are ignored.
 
     Args:
-        data: Dictionary with cleaned video data
+        sidecar_path: Path to .npz file
+        data: Loaded cleaned data with "_series" array
+        source: (mtime in ns, size in bytes) of the JSON file the data was loaded from
+    """
+    meta = {k: v for k, v in data.items() if k not in ("data", "_series")}
+    try:
+        np.savez(
+            sidecar_path,
+            series=data["_series"],
+            meta=np.array(json.dumps(meta)),
+            source=np.array(source, dtype=np.int64),
+        )
+    except OSError:
+        pass
+
+
+def load_series_sidecar(
+    sidecar_path: Path, source: Tuple[int, int]
+) -> Optional[Dict[str, Any]]:
     """
-    video_data = data["data"]
+    Load series array and file metadata from a .npz sidecar.
 
-    if not video_data:
-        raise ValueError("No data to plot")
+    Args:
+        sidecar_path: Path to .npz file
+        source: (mtime in ns, size in bytes) of the current JSON file
+
+    Returns:
+        Dictionary with file metadata and "_series" array, or None if the
+        sidecar was written for a different version of the JSON file or
+        cannot be read (e.g. truncated by an interrupted write)
+    """
+    try:
+        with np.load(sidecar_path) as sidecar:
+            if "source" not in sidecar or tuple(sidecar["source"].tolist()) != source:
+                return None
+            data = json.loads(sidecar["meta"].item())
+            data["_series"] = sidecar["series"]
+    except (OSError, EOFError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+    return data
 
-    # Extract data
-    # Use time_sec_precise if available, otherwise fall back to time_sec
-    time_sec = np.array([
-        item.get("time_sec_precise", item["time_sec"]) 
+
+def build_series_array(video_data: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Build a single (N, 4) float32 array from cleaned data points.
+
+    Columns are time (time_sec_precise if available, otherwise time_sec),
+    current_A, mps_V and mag_V. The array is filled in one pass over the
+    data points with a preallocated buffer. Rows are sorted by time, since
+    OCR time fallbacks can step backwards and the plot's range lookups
+    (np.searchsorted) need increasing time.
+
+    Args:
+        video_data: List of cleaned data point dictionaries
+
+    Returns:
+        Array of shape (N, 4) with dtype float32, sorted by time
+    """
+    n = len(video_data)
+    values = chain.from_iterable(
+        (
+            item.get("time_sec_precise", item["time_sec"]),
+            item["current_A"],
+            item["mps_V"],
+            item["mag_V"],
+        )
         for item in video_data
-    ])
-    current_a = np.array([item["current_A"] for item in video_data])
-    mps_v = np.array([item["mps_V"] for item in video_data])
-    mag_v = np.array([item["mag_V"] for item in video_data])
-    
-    # Downsample data for faster rendering if there are too many points
-    # Keep every Nth point for display
-    max_display_points = 1000
-    if len(time_sec) > max_display_points:
-        downsample_factor = len(time_sec) // max_display_points
-        display_indices = np.arange(0, len(time_sec), downsample_factor)
-        time_sec_display = time_sec[display_indices]
-        current_a_display = current_a[display_indices]
-        mps_v_display = mps_v[display_indices]
-        mag_v_display = mag_v[display_indices]
-        print(f"Displaying {len(time_sec_display)} of {len(time_sec)} points for performance")
-    else:
-        time_sec_display = time_sec
-        current_a_display = current_a
-        mps_v_display = mps_v
-        mag_v_display = mag_v
+    )
+    series = np.fromiter(values, dtype=np.float32, count=n * 4).reshape(n, 4)
+
+    # Stable sort keeps the original order of equal times
+    if n > 1 and (np.diff(series[:, 0]) < 0).any():
+        series = series[np.argsort(series[:, 0], kind="stable")]
+    return series
 
-    # Calculate initial axis limits
-    time_min, time_max = time_sec.min(), time_sec.max()
-    current_min, current_max = current_a.min(), current_a.max()
-    voltage_min = min(mps_v.min(), mag_v.min())
-    voltage_max = max(mps_v.max(), mag_v.max())
+
+def calculate_axis_limits(
+    series: np.ndarray,
+) -> Tuple[List[float], List[float], Dict[str, float]]:
+    """
+    Calculate data extents and padded initial axis limits.
+    Time is padded by 5% of its range, current and voltage by 10%.
+    Both voltages share one axis.
+
+    Args:
+        series: Array of shape (N, 4) from build_series_array
+
+    Returns:
+        Tuple of (column minimums, column maximums, initial limits keyed
+        'time_min', 'time_max', 'current_min', ..., 'voltage_max')
+    """
+    # Column-wise reductions give all extents in two passes over the buffer
+    data_min = series.min(axis=0).tolist()
+    data_max = series.max(axis=0).tolist()
+    time_min, time_max = data_min[0], data_max[0]
+    current_min, current_max = data_min[1], data_max[1]
+    voltage_min = min(data_min[2], data_min[3])
+    voltage_max = max(data_max[2], data_max[3])
 
     # Add some padding to limits
     time_padding = (time_max - time_min) * 0.05
     current_padding = (current_max - current_min) * 0.1
     voltage_padding = (voltage_max - voltage_min) * 0.1
 
-    time_min -= time_padding
-    time_max += time_padding
-    current_min -= current_padding
-    current_max += current_padding
-    voltage_min -= voltage_padding
-    voltage_max += voltage_padding
+    initial_limits = {
+        'time_min': time_min - time_padding,
+        'time_max': time_max + time_padding,
+        'current_min': current_min - current_padding,
+        'current_max': current_max + current_padding,
+        'voltage_min': voltage_min - voltage_padding,
+        'voltage_max': voltage_max + voltage_padding,
+    }
+    return data_min, data_max, initial_limits
+
+
+# Rendering settings of the interactive matplotlib plot
+MPL_RC_PARAMS = {
+    'path.simplify': True,
+    'path.simplify_threshold': 1.0,
+    'agg.path.chunksize': 10000,
+}
+
+
+@lru_cache(maxsize=None)
+def _lazy_mpl() -> Tuple[Any, Any, Any]:
+    """
+    Import matplotlib on first use.
+    Importing pyplot selects a GUI backend, which is slow, so it is
+    deferred until a plot is actually created.
+
+    Returns:
+        Tuple of (pyplot module, Button class, TextBox class)
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.widgets import Button, TextBox
+
+    return plt, Button, TextBox
+
+
+def plot_interactive(data: Dict[str, Any]) -> None:
+    """
+    Create interactive plot with dynamic axis limits.
+    Agg simplifies and chunks long paths before stroking them; the settings
+    only apply while the window is open, not to other plots of the process.
+
+    Args:
+        data: Dictionary with cleaned video data
+    """
+    plt, _, _ = _lazy_mpl()
+    with plt.rc_context(MPL_RC_PARAMS):
+        _plot_interactive(data)
+
+
+def _plot_interactive(data: Dict[str, Any]) -> None:
+    """
+    Create the interactive plot and show it until the window is closed.
+
+    Args:
+        data: Dictionary with cleaned video data
+    """
+    plt, Button, TextBox = _lazy_mpl()
+
+    # Extract data into one contiguous buffer, columns are views
+    series = data.get("_series")
+    if series is None:
+        series = build_series_array(data["data"])
+
+    if len(series) == 0:
+        raise ValueError("No data to plot")
+
+    time_sec = series[:, 0]
+    current_a = series[:, 1]
+    mps_v = series[:, 2]
+    mag_v = series[:, 3]
+
+    # Calculate initial axis limits
+    data_min, data_max, initial_limits = calculate_axis_limits(series)
+    time_min, time_max = initial_limits['time_min'], initial_limits['time_max']
+    current_min, current_max = initial_limits['current_min'], initial_limits['current_max']
+    voltage_min, voltage_max = initial_limits['voltage_min'], initial_limits['voltage_max']
 
     # Create figure with space for text input fields
     fig = plt.figure(figsize=(16, 10))
     
     # Main plot area (more space since no sliders)
     # [left, bottom, width, height]
-    ax_plot = plt.axes([0.12, 0.12, 0.75, 0.75])
+    ax_plot = plt.axes(PLOT_RECT)
     
     # Create twin axis for voltages
     ax_voltage = ax_plot.twinx()
 
+    # Downsample data for faster rendering if there are too many points
+    # MinMaxLTTB keeps the visual shape of the ramp, one point per pixel column;
+    # each series is downsampled on its own and the union of the indices is
+    # shown on all of them, so they stay aligned in time and no spike is lost
+    max_display_points = int(ax_plot.bbox.width)
+    if len(time_sec) > max_display_points:
+        display_indices = minmax_lttb_union_indices(
+            time_sec, (current_a, mps_v, mag_v), max_display_points
+        )
+        time_sec_display = time_sec[display_indices]
+        current_a_display = current_a[display_indices]
+        mps_v_display = mps_v[display_indices]
+        mag_v_display = mag_v[display_indices]
+        print(f"Displaying {len(time_sec_display)} of {len(time_sec)} points for performance")
+    else:
+        time_sec_display = time_sec
+        current_a_display = current_a
+        mps_v_display = mps_v
+        mag_v_display = mag_v
+
     # Plot data
     color_current = "red"
     color_mps = "cyan"
     color_mag = "purple"
 
+    # Plain solid strokes render much faster in Agg than per-point marker paths,
+    # so markers are only drawn when few points are displayed
+    show_markers = len(time_sec_display) < 100
+    line_style = dict(
+        linewidth=1.5, alpha=0.9, antialiased=False,
+        solid_capstyle='butt', solid_joinstyle='miter', markersize=4, markeredgewidth=0.5
+    )
+
     ax_plot.set_xlabel("Time (seconds)", fontsize=12)
     ax_plot.set_ylabel("Current (A)", color=color_current, fontsize=12)
     line1, = ax_plot.plot(
-        time_sec_display, current_a_display, color=color_current, linewidth=1.5,
-        marker='o', markersize=4, markerfacecolor=color_current, 
-        markeredgecolor='darkred', markeredgewidth=0.5, alpha=0.9, antialiased=True
+        time_sec_display, current_a_display, color=color_current,
+        marker='o' if show_markers else None, markerfacecolor=color_current,
+        markeredgecolor='darkred', **line_style
     )
     ax_plot.tick_params(axis="y", labelcolor=color_current)
-    ax_plot.grid(True, alpha=0.3)
+    ax_plot.grid(True, alpha=0.3, antialiased=False)
 
     ax_voltage.set_ylabel("Voltage (V)", fontsize=12)
     line2, = ax_voltage.plot(
-        time_sec_display, mps_v_display, color=color_mps, linewidth=1.5,
-        marker='s', markersize=4, markerfacecolor=color_mps, 
-        markeredgecolor='darkcyan', markeredgewidth=0.5, alpha=0.9, antialiased=True
+        time_sec_display, mps_v_display, color=color_mps,
+        marker='s' if show_markers else None, markerfacecolor=color_mps,
+        markeredgecolor='darkcyan', **line_style
     )
     line3, = ax_voltage.plot(
-        time_sec_display, mag_v_display, color=color_mag, linewidth=1.5,
-        marker='^', markersize=4, markerfacecolor=color_mag, 
-        markeredgecolor='darkmagenta', markeredgewidth=0.5, alpha=0.9, antialiased=True
+        time_sec_display, mag_v_display, color=color_mag,
+        marker='^' if show_markers else None, markerfacecolor=color_mag,
+        markeredgecolor='darkmagenta', **line_style
     )
 
+    # Point values on hover: the toolbar shows the sample nearest to the
+    # cursor, which needs no extra artists and no redraw
+    def format_coord(x, y):
+        """Format the values of the sample nearest to time x."""
+        i = min(int(np.searchsorted(time_sec, time_sec.dtype.type(x))), len(time_sec) - 1)
+        if i > 0 and x - time_sec[i - 1] < time_sec[i] - x:
+            i -= 1
+        return (
+            f"t={time_sec[i]:.1f} s  I={current_a[i]:.1f} A  "
+            f"MPS={mps_v[i]:.2f} V  MAG={mag_v[i]:.2f} V"
+        )
+
+    ax_plot.format_coord = format_coord
+    ax_voltage.format_coord = format_coord
+
     # Title
     video_name = data.get("video", "Unknown")
     ax_plot.set_title(f"MRI Ramp Data Analysis: {video_name}", fontsize=14, fontweight="bold")
@@ -135,161 +372,126 @@ def plot_interactive(data: Dict[str, Any]) -> None:
     ax_voltage.set_ylim(voltage_min, voltage_max)
 
     # Create text input fields for axis limits (no sliders for better performance)
-    textbox_width = 0.08
-    textbox_height = 0.035
-    
-    # Store current limits for reset
-    initial_limits = {
-        'time_min': time_min,
-        'time_max': time_max,
-        'current_min': current_min,
-        'current_max': current_max,
-        'voltage_min': voltage_min,
-        'voltage_max': voltage_max
-    }
-    
-    # === TIME AXIS TEXTBOXES (below X-axis, at bottom) ===
-    ax_time_min_text = plt.axes([0.12, 0.02, textbox_width, textbox_height])
-    ax_time_max_text = plt.axes([0.79 - textbox_width, 0.02, textbox_width, textbox_height])
-    
-    textbox_time_min = TextBox(ax_time_min_text, 'Time min (s)', initial=f"{time_min:.1f}", textalignment='center')
-    textbox_time_max = TextBox(ax_time_max_text, 'Time max (s)', initial=f"{time_max:.1f}", textalignment='center')
-    
-    # === CURRENT AXIS TEXTBOXES (left side: min at bottom, max at top) ===
-    ax_current_min_text = plt.axes([0.02, 0.12, textbox_width, textbox_height])
-    ax_current_max_text = plt.axes([0.02, 0.87, textbox_width, textbox_height])
-    
-    textbox_current_min = TextBox(ax_current_min_text, 'Current min (A)', initial=f"{current_min:.1f}", textalignment='center')
-    textbox_current_max = TextBox(ax_current_max_text, 'Current max (A)', initial=f"{current_max:.1f}", textalignment='center')
-    
-    # === VOLTAGE AXIS TEXTBOXES (right side: min at bottom, max at top) ===
-    ax_voltage_min_text = plt.axes([0.90, 0.12, textbox_width, textbox_height])
-    ax_voltage_max_text = plt.axes([0.90, 0.87, textbox_width, textbox_height])
-    
-    textbox_voltage_min = TextBox(ax_voltage_min_text, 'Voltage min (V)', initial=f"{voltage_min:.2f}", textalignment='center')
-    textbox_voltage_max = TextBox(ax_voltage_max_text, 'Voltage max (V)', initial=f"{voltage_max:.2f}", textalignment='center')
+    textboxes = {}
+    for spec in LIMIT_TEXTBOXES:
+        ax_text = plt.axes([spec.left, spec.bottom, TEXTBOX_WIDTH, TEXTBOX_HEIGHT])
+        textboxes[spec.key] = TextBox(
+            ax_text, spec.label, initial=format(initial_limits[spec.key], spec.fmt),
+            textalignment='center'
+        )
     
     # Function to handle textbox clicks - move cursor to end for easier editing
+    textbox_by_axes = {textbox.ax: textbox for textbox in textboxes.values()}
+
     def on_textbox_click(event):
         """Handle textbox clicks - move cursor to end for easier text selection/editing."""
-        if hasattr(event, 'inaxes') and event.inaxes:
-            # Find which textbox was clicked
-            for textbox in [textbox_time_min, textbox_time_max, 
-                          textbox_current_min, textbox_current_max,
-                          textbox_voltage_min, textbox_voltage_max]:
-                if event.inaxes == textbox.ax:
-                    # Get current text and move cursor to end
-                    # This makes it easier to select all text manually (Ctrl+A or triple-click)
-                    # or to append/overwrite the value
-                    current_text = textbox.text_disp.get_text()
-                    textbox.cursor_index = len(current_text)
-                    textbox._rendercursor()
-                    break
+        if event.inaxes is None:
+            return
+        textbox = textbox_by_axes.get(event.inaxes)
+        if textbox is not None:
+            # Get current text and move cursor to end
+            # This makes it easier to select all text manually (Ctrl+A or triple-click)
+            # or to append/overwrite the value
+            current_text = textbox.text_disp.get_text()
+            textbox.cursor_index = len(current_text)
+            textbox._rendercursor()
     
     # Connect click event for textbox interaction
     fig.canvas.mpl_connect('button_press_event', on_textbox_click)
 
     # Reset button (top left corner)
-    ax_reset = plt.axes([0.02, 0.92, 0.08, 0.04])
+    ax_reset = plt.axes(RESET_BUTTON_RECT)
     btn_reset = Button(ax_reset, 'Reset', color='lightgray', hovercolor='gray')
 
-    # Update functions for textboxes (directly update plot limits)
-    # All functions preserve decimal precision when updating
-    def update_time_min(text):
-        try:
-            val = float(text)
-            current_max = float(textbox_time_max.text_disp.get_text())
-            if val < current_max:
-                ax_plot.set_xlim(val, current_max)
-                # Update textbox to show formatted value (preserves decimal if entered)
-                textbox_time_min.set_val(f"{val:.1f}")
-                ax_plot.figure.canvas.draw_idle()
-            else:
-                # Invalid range, restore previous value
-                textbox_time_min.set_val(f"{ax_plot.get_xlim()[0]:.1f}")
-        except ValueError:
-            # Invalid input, restore previous value
-            textbox_time_min.set_val(f"{ax_plot.get_xlim()[0]:.1f}")
-    
-    def update_time_max(text):
-        try:
-            val = float(text)
-            current_min = float(textbox_time_min.text_disp.get_text())
-            if val > current_min:
-                ax_plot.set_xlim(current_min, val)
-                # Update textbox to show formatted value (preserves decimal if entered)
-                textbox_time_max.set_val(f"{val:.1f}")
-                ax_plot.figure.canvas.draw_idle()
-            else:
-                # Invalid range, restore previous value
-                textbox_time_max.set_val(f"{ax_plot.get_xlim()[1]:.1f}")
-        except ValueError:
-            # Invalid input, restore previous value
-            textbox_time_max.set_val(f"{ax_plot.get_xlim()[1]:.1f}")
-    
-    def update_current_min(text):
-        try:
-            val = float(text)
-            current_max = float(textbox_current_max.text_disp.get_text())
-            if val < current_max:
-                ax_plot.set_ylim(val, current_max)
-                # Update textbox to show formatted value (preserves decimal if entered)
-                textbox_current_min.set_val(f"{val:.1f}")
-                ax_plot.figure.canvas.draw_idle()
-            else:
-                # Invalid range, restore previous value
-                textbox_current_min.set_val(f"{ax_plot.get_ylim()[0]:.1f}")
-        except ValueError:
-            # Invalid input, restore previous value
-            textbox_current_min.set_val(f"{ax_plot.get_ylim()[0]:.1f}")
-    
-    def update_current_max(text):
-        try:
-            val = float(text)
-            current_min = float(textbox_current_min.text_disp.get_text())
-            if val > current_min:
-                ax_plot.set_ylim(current_min, val)
-                # Update textbox to show formatted value (preserves decimal if entered)
-                textbox_current_max.set_val(f"{val:.1f}")
-                ax_plot.figure.canvas.draw_idle()
-            else:
-                # Invalid range, restore previous value
-                textbox_current_max.set_val(f"{ax_plot.get_ylim()[1]:.1f}")
-        except ValueError:
-            # Invalid input, restore previous value
-            textbox_current_max.set_val(f"{ax_plot.get_ylim()[1]:.1f}")
-    
-    def update_voltage_min(text):
-        try:
-            val = float(text)
-            current_max = float(textbox_voltage_max.text_disp.get_text())
-            if val < current_max:
-                ax_voltage.set_ylim(val, current_max)
-                # Update textbox to show formatted value (preserves decimal if entered)
-                textbox_voltage_min.set_val(f"{val:.2f}")
-                ax_plot.figure.canvas.draw_idle()
-            else:
-                # Invalid range, restore previous value
-                textbox_voltage_min.set_val(f"{ax_voltage.get_ylim()[0]:.2f}")
-        except ValueError:
-            # Invalid input, restore previous value
-            textbox_voltage_min.set_val(f"{ax_voltage.get_ylim()[0]:.2f}")
-    
-    def update_voltage_max(text):
-        try:
-            val = float(text)
-            current_min = float(textbox_voltage_min.text_disp.get_text())
-            if val > current_min:
-                ax_voltage.set_ylim(current_min, val)
-                # Update textbox to show formatted value (preserves decimal if entered)
-                textbox_voltage_max.set_val(f"{val:.2f}")
-                ax_plot.figure.canvas.draw_idle()
-            else:
-                # Invalid range, restore previous value
-                textbox_voltage_max.set_val(f"{ax_voltage.get_ylim()[1]:.2f}")
-        except ValueError:
-            # Invalid input, restore previous value
-            textbox_voltage_max.set_val(f"{ax_voltage.get_ylim()[1]:.2f}")
+    # Line data is only ever replaced on the existing artists, never re-plotted
+    line_markers = ((line1, 'o'), (line2, 's'), (line3, '^'))
+
+    def redraw_lines(indices):
+        """Show the points at the given indices (array or slice) on all three lines."""
+        time_display = time_sec[indices]
+        line1.set_data(time_display, current_a[indices])
+        line2.set_data(time_display, mps_v[indices])
+        line3.set_data(time_display, mag_v[indices])
+        show_markers = len(time_display) < 100
+        for line, marker in line_markers:
+            line.set_marker(marker if show_markers else 'None')
+
+    def refit_to_xlim():
+        """Re-downsample the data inside the visible time range."""
+        # Limits are float64; searching with them would first cast the whole
+        # float32 time array to float64, so convert the limits instead
+        t0, t1 = map(time_sec.dtype.type, ax_plot.get_xlim())
+        # Include one point beyond each edge so the lines reach the plot border
+        lo = max(int(np.searchsorted(time_sec, t0)) - 1, 0)
+        hi = min(int(np.searchsorted(time_sec, t1)) + 1, len(time_sec))
+        if hi - lo <= max_display_points:
+            # Basic slicing gives views, no index array or copies needed
+            redraw_lines(slice(lo, hi))
+        else:
+            indices = minmax_lttb_union_indices(
+                time_sec[lo:hi], (current_a[lo:hi], mps_v[lo:hi], mag_v[lo:hi]), max_display_points
+            )
+            redraw_lines(lo + indices)
+
+    # Limits are applied immediately, but re-downsampling and redrawing are
+    # deferred by a single-shot timer so several quick edits cause one redraw
+    pending = {'refit': False}
+    redraw_timer = fig.canvas.new_timer(interval=50)
+    redraw_timer.single_shot = True
+
+    def apply_pending_redraw():
+        if pending['refit']:
+            pending['refit'] = False
+            refit_to_xlim()
+        fig.canvas.draw_idle()
+
+    redraw_timer.add_callback(apply_pending_redraw)
+
+    def schedule_redraw(refit=False):
+        """Restart the redraw timer, optionally re-fitting lines to the time range."""
+        pending['refit'] = pending['refit'] or refit
+        redraw_timer.stop()
+        redraw_timer.start()
+
+    def show_value(textbox, value, fmt):
+        """Display a formatted value without re-triggering the textbox callbacks."""
+        text = format(value, fmt)
+        if textbox.text != text:
+            textbox.eventson = False
+            textbox.set_val(text)
+            textbox.eventson = True
+
+    # Update function factory for textboxes (directly update plot limits)
+    # The opposite bound is read from the axis limits, which are always current
+    # All callbacks preserve decimal precision when updating
+    def make_updater(textbox, get_lim, set_lim, is_min, fmt, refit):
+        """Create a textbox callback that updates the lower or upper bound of an axis."""
+        index = 0 if is_min else 1
+
+        def update(text):
+            try:
+                val = float(text)
+                other = get_lim()[1 - index]
+                if (val < other) if is_min else (val > other):
+                    set_lim((val, other) if is_min else (other, val))
+                    # Update textbox to show formatted value (preserves decimal if entered)
+                    show_value(textbox, val, fmt)
+                    schedule_redraw(refit=refit)
+                else:
+                    # Invalid range, restore previous value
+                    show_value(textbox, get_lim()[index], fmt)
+            except ValueError:
+                # Invalid input, restore previous value
+                show_value(textbox, get_lim()[index], fmt)
+
+        return update
+
+    # Axis name -> (limit getter, limit setter, re-fit lines to the time range)
+    axis_limits = {
+        'time': (ax_plot.get_xlim, ax_plot.set_xlim, True),
+        'current': (ax_plot.get_ylim, ax_plot.set_ylim, False),
+        'voltage': (ax_voltage.get_ylim, ax_voltage.set_ylim, False),
+    }
 
     # Reset function
     def reset(event):
@@ -299,25 +501,24 @@ def plot_interactive(data: Dict[str, Any]) -> None:
         ax_voltage.set_ylim(initial_limits['voltage_min'], initial_limits['voltage_max'])
         
         # Update textboxes
-        textbox_time_min.set_val(f"{initial_limits['time_min']:.1f}")
-        textbox_time_max.set_val(f"{initial_limits['time_max']:.1f}")
-        textbox_current_min.set_val(f"{initial_limits['current_min']:.1f}")
-        textbox_current_max.set_val(f"{initial_limits['current_max']:.1f}")
-        textbox_voltage_min.set_val(f"{initial_limits['voltage_min']:.2f}")
-        textbox_voltage_max.set_val(f"{initial_limits['voltage_max']:.2f}")
+        for spec in LIMIT_TEXTBOXES:
+            show_value(textboxes[spec.key], initial_limits[spec.key], spec.fmt)
         
-        ax_plot.figure.canvas.draw_idle()
+        schedule_redraw(refit=True)
     
     # Connect textboxes to update functions
-    textbox_time_min.on_submit(update_time_min)
-    textbox_time_max.on_submit(update_time_max)
-    textbox_current_min.on_submit(update_current_min)
-    textbox_current_max.on_submit(update_current_max)
-    textbox_voltage_min.on_submit(update_voltage_min)
-    textbox_voltage_max.on_submit(update_voltage_max)
+    for spec in LIMIT_TEXTBOXES:
+        axis, bound = spec.key.split('_')
+        get_lim, set_lim, refit = axis_limits[axis]
+        textbox = textboxes[spec.key]
+        textbox.on_submit(make_updater(textbox, get_lim, set_lim, bound == 'min', spec.fmt, refit))
     
     # Connect reset button
     btn_reset.on_clicked(reset)
+
+    # Toolbar pan/zoom changes the time range without going through the
+    # textboxes, re-fit the lines to it once the interaction pauses
+    ax_plot.callbacks.connect('xlim_changed', lambda ax: schedule_redraw(refit=True))
     
     # Helper function to select all text on double-click or focus
     def make_textbox_selectable(textbox):
@@ -334,11 +535,11 @@ def plot_interactive(data: Dict[str, Any]) -> None:
 
     # Display statistics (top of figure)
     if len(time_sec_display) < len(time_sec):
-        stats_text = f"Data points: {len(video_data)} (displaying {len(time_sec_display)} for performance) | "
+        stats_text = f"Data points: {len(series)} (displaying {len(time_sec_display)} for performance) | "
     else:
-        stats_text = f"Data points: {len(video_data)} | "
-    stats_text += f"Time range: {time_sec.min():.1f}-{time_sec.max():.1f}s | "
-    stats_text += f"Current: {current_a.min():.1f}-{current_a.max():.1f}A | "
+        stats_text = f"Data points: {len(series)} | "
+    stats_text += f"Time range: {data_min[0]:.1f}-{data_max[0]:.1f}s | "
+    stats_text += f"Current: {data_min[1]:.1f}-{data_max[1]:.1f}A | "
     stats_text += f"Voltage: {voltage_min:.2f}-{voltage_max:.2f}V"
     
     fig.text(0.5, 0.97, stats_text, ha='center', fontsize=9, style='italic')
@@ -350,8 +551,13 @@ def plot_interactive(data: Dict[str, Any]) -> None:
     plt.show()
 
 
-def run_analyze() -> None:
-    """Run Analyze: Interactive analysis of cleaned data."""
+def run_analyze(backend: str = "mpl") -> None:
+    """
+    Run Analyze: Interactive analysis of cleaned data.
+
+    Args:
+        backend: Plotting backend, "mpl" for matplotlib or "pg" for pyqtgraph
+    """
     print("Analyze: Interactive Data Analysis")
     print("=" * 50)
 
@@ -366,14 +572,19 @@ def run_analyze() -> None:
         data = load_cleaned_data(cleaned_path)
         print(f"Loaded cleaned data from: {cleaned_path}")
         print(f"Video: {data.get('video', 'Unknown')}")
-        print(f"Data points: {len(data['data'])}")
+        print(f"Data points: {len(data['_series'])}")
         print(f"\nOpening interactive plot...")
         print("Enter values in text fields and press Enter to update axis limits.")
         print("Use Ctrl+A or triple-click to select all text in a field.")
         print("Click 'Reset' button to restore default limits.")
 
         # Create interactive plot
-        plot_interactive(data)
+        if backend == "pg":
+            from smva.analyze_pg import plot_interactive_pg
+
+            plot_interactive_pg(data)
+        else:
+            plot_interactive(data)
 
         print("\nAnalysis completed!")
     except Exception as e:
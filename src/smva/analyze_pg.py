@@ -0,0 +1,135 @@
+"""Analyze with pyqtgraph: interactive plot rendered by Qt instead of matplotlib."""
+
+from typing import Any, Dict
+
+try:
+    import pyqtgraph as pg
+    from pyqtgraph.Qt import QtWidgets
+except ImportError:  # pyqtgraph is optional, the matplotlib plot is the default
+    pg = None
+
+from smva.analyze import LIMIT_TEXTBOXES, build_series_array, calculate_axis_limits
+
+
+def plot_interactive_pg(data: Dict[str, Any]) -> None:
+    """
+    Create interactive plot with pyqtgraph.
+    Current and voltages are shown in two plots sharing the time axis.
+    pyqtgraph clips lines to the visible range and peak-downsamples them,
+    so redraw cost depends on the plot width rather than on data size.
+
+    Args:
+        data: Dictionary with cleaned video data
+    """
+    if pg is None:
+        raise ImportError(
+            "pyqtgraph is not installed. Install it with: pip install -e '.[pyqtgraph]'"
+        )
+
+    series = data.get("_series")
+    if series is None:
+        series = build_series_array(data["data"])
+
+    if len(series) == 0:
+        raise ValueError("No data to plot")
+
+    time_sec = series[:, 0]
+    _, _, initial_limits = calculate_axis_limits(series)
+
+    app = pg.mkQApp("SMVA Analyze")
+    window = QtWidgets.QWidget()
+    window.setWindowTitle(f"MRI Ramp Data Analysis: {data.get('video', 'Unknown')}")
+    window.resize(1600, 1000)
+    layout = QtWidgets.QVBoxLayout(window)
+
+    plots = pg.GraphicsLayoutWidget()
+    layout.addWidget(plots)
+    plot_current = plots.addPlot(row=0, col=0)
+    plot_voltage = plots.addPlot(row=1, col=0)
+    plot_voltage.setXLink(plot_current)
+
+    for plot_item in (plot_current, plot_voltage):
+        plot_item.setClipToView(True)
+        plot_item.setDownsampling(auto=True, mode="peak")
+        plot_item.showGrid(x=True, y=True, alpha=0.3)
+
+    plot_current.setLabel("left", "Current (A)")
+    plot_voltage.setLabel("left", "Voltage (V)")
+    plot_voltage.setLabel("bottom", "Time (seconds)")
+    plot_voltage.addLegend()
+
+    plot_current.plot(time_sec, series[:, 1], pen=pg.mkPen("r", width=1.5))
+    plot_voltage.plot(time_sec, series[:, 2], pen=pg.mkPen("c", width=1.5), name="MPS (V)")
+    plot_voltage.plot(
+        time_sec, series[:, 3], pen=pg.mkPen((128, 0, 128), width=1.5), name="MAG (V)"
+    )
+
+    # Axis name -> (view box, 0 for the x range or 1 for the y range)
+    view_ranges = {
+        'time': (plot_current.getViewBox(), 0),
+        'current': (plot_current.getViewBox(), 1),
+        'voltage': (plot_voltage.getViewBox(), 1),
+    }
+
+    def set_range(axis, lo, hi):
+        view, index = view_ranges[axis]
+        if index == 0:
+            view.setXRange(lo, hi, padding=0)
+        else:
+            view.setYRange(lo, hi, padding=0)
+
+    def reset():
+        for axis in view_ranges:
+            set_range(axis, initial_limits[f"{axis}_min"], initial_limits[f"{axis}_max"])
+
+    # Limit fields, committed on Enter or focus change like the matplotlib textboxes
+    controls = QtWidgets.QHBoxLayout()
+    layout.addLayout(controls)
+    spinboxes = {}
+    for spec in LIMIT_TEXTBOXES:
+        spinbox = QtWidgets.QDoubleSpinBox()
+        spinbox.setDecimals(spec.decimals)
+        spinbox.setRange(-1e9, 1e9)
+        spinbox.setKeyboardTracking(False)
+        controls.addWidget(QtWidgets.QLabel(spec.label))
+        controls.addWidget(spinbox)
+        spinboxes[spec.key] = spinbox
+
+    btn_reset = QtWidgets.QPushButton("Reset")
+    btn_reset.clicked.connect(reset)
+    controls.addWidget(btn_reset)
+
+    def show_limits():
+        """Show the visible ranges (also after mouse zoom/pan) in the limit fields."""
+        for key, spinbox in spinboxes.items():
+            axis, bound = key.split('_')
+            view, index = view_ranges[axis]
+            spinbox.blockSignals(True)
+            spinbox.setValue(view.viewRange()[index][bound == 'max'])
+            spinbox.blockSignals(False)
+
+    def make_updater(key):
+        """Create a spinbox callback that updates the lower or upper bound of an axis."""
+        axis, bound = key.split('_')
+        view, index = view_ranges[axis]
+
+        def update(value):
+            lo, hi = view.viewRange()[index]
+            lo, hi = (value, hi) if bound == 'min' else (lo, value)
+            if lo < hi:
+                set_range(axis, lo, hi)
+            else:
+                # Invalid range, restore previous value
+                show_limits()
+
+        return update
+
+    for key, spinbox in spinboxes.items():
+        spinbox.valueChanged.connect(make_updater(key))
+
+    for view in (plot_current.getViewBox(), plot_voltage.getViewBox()):
+        view.sigRangeChanged.connect(lambda *args: show_limits())
+
+    reset()
+    window.show()
+    app.exec()
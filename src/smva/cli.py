@@ -22,9 +22,14 @@ def setup_roi():
 
 
 @main.command(name="test-ocr")
-def test_ocr():
+@click.option(
+    "--save-full-frames",
+    is_flag=True,
+    help="Also save full frames with the ROI rectangle marked.",
+)
+def test_ocr(save_full_frames):
     """Test OCR: Test OCR processing on sample frames for verification."""
-    run_test_ocr()
+    run_test_ocr(save_full_frames)
 
 
 @main.command(name="extract")
@@ -40,9 +45,16 @@ def plot():
 
 
 @main.command(name="analyze")
-def analyze():
+@click.option(
+    "--backend",
+    type=click.Choice(["mpl", "pg"]),
+    default="mpl",
+    show_default=True,
+    help="Plotting backend: matplotlib or pyqtgraph (needs the 'pyqtgraph' extra).",
+)
+def analyze(backend):
     """Analyze: Interactive analysis of cleaned data with dynamic axis limits."""
-    run_analyze()
+    run_analyze(backend)
 
 
 if __name__ == "__main__":
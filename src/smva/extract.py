@@ -1,13 +1,17 @@
 """Extract: Full video processing with frame sampling and fallback."""
 
-import json
+import os
 import cv2
+import numpy as np
 import tkinter as tk
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import filedialog
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional
 
-from smva.utils.video import get_video_metadata
+from smva.utils.video import SequentialROIReader, get_video_metadata, open_video_capture
+from smva.utils.jsonio import save_json
 from smva.utils.roi import load_roi_config
 from smva.utils.ocr import extract_text_from_roi, parse_mri_data, time_string_to_seconds
 
@@ -30,53 +34,6 @@ def calculate_time_from_frame(frame_num: int, fps: float) -> tuple[float, int]:
     return time_sec_precise, time_ms
 
 
-def extract_time_from_frames(
-    cap: cv2.VideoCapture,
-    frame_numbers: List[int],
-    roi: Dict[str, int],
-) -> Optional[float]:
-    """
-    Extract and average time from multiple frames.
-
-    Args:
-        cap: Video capture object
-        frame_numbers: List of frame numbers to sample
-        roi: ROI coordinates (x, y, w, h)
-
-    Returns:
-        Average time in seconds or None if extraction failed
-    """
-    x, y, w, h = roi["x"], roi["y"], roi["w"], roi["h"]
-    times = []
-
-    for frame_num in frame_numbers:
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
-        ret, frame = cap.read()
-
-        if not ret:
-            continue
-
-        # Crop ROI
-        roi_image = frame[y : y + h, x : x + w]
-
-        # Perform OCR
-        text = extract_text_from_roi(roi_image)
-
-        # Parse data
-        parsed_data = parse_mri_data(text)
-
-        if parsed_data:
-            time_sec = time_string_to_seconds(parsed_data["time"])
-            times.append(time_sec)
-
-    if len(times) == 0:
-        return None
-
-    # Return median to avoid outliers
-    times.sort()
-    return times[len(times) // 2]
-
-
 def validate_extracted_data(
     parsed_data: Dict[str, Any],
     frame_num: int,
@@ -182,9 +139,8 @@ def select_video_file() -> Optional[Path]:
 
 
 def try_parse_frame(
-    cap: cv2.VideoCapture,
+    read_roi: Callable[[int], Optional[cv2.Mat]],
     frame_num: int,
-    roi: Dict[str, int],
     fps: float,
     validation_config: Dict[str, float],
     previous_data: Optional[Dict[str, Any]] = None,
@@ -196,9 +152,8 @@ def try_parse_frame(
     Optionally tries multiple nearby frames to avoid green square artifacts.
 
     Args:
-        cap: Video capture object
+        read_roi: Function returning the ROI image of a frame number, or None
         frame_num: Frame number to process
-        roi: ROI coordinates (x, y, w, h)
         fps: Frames per second
         validation_config: Validation configuration with limits
         previous_data: Previous successfully parsed frame data for validation
@@ -208,8 +163,6 @@ def try_parse_frame(
     Returns:
         Parsed data dictionary or None if failed
     """
-    x, y, w, h = roi["x"], roi["y"], roi["w"], roi["h"]
-
     # Try multiple frames to avoid green square artifacts
     frames_to_try = [frame_num]
     if try_multiple_frames:
@@ -220,16 +173,12 @@ def try_parse_frame(
     
     parsed_data = None
     for try_frame in frames_to_try:
-        # Seek to frame
-        cap.set(cv2.CAP_PROP_POS_FRAMES, try_frame)
-        ret, frame = cap.read()
+        # Get ROI of frame (decoded sequentially, no seek for nearby frames)
+        roi_image = read_roi(try_frame)
 
-        if not ret:
+        if roi_image is None:
             continue
 
-        # Crop ROI
-        roi_image = frame[y : y + h, x : x + w]
-
         # Perform OCR
         text = extract_text_from_roi(roi_image)
 
@@ -271,41 +220,42 @@ def try_parse_frame(
 
 
 def process_frame_with_fallback(
-    cap: cv2.VideoCapture,
+    read_roi: Callable[[int], Optional[cv2.Mat]],
     target_frame: int,
-    roi: Dict[str, int],
     fps: float,
     validation_config: Dict[str, float],
     previous_data: Optional[Dict[str, Any]] = None,
     max_pause_threshold: Optional[float] = None,
     max_fallback_range: int = 5,
+    start_offset: int = 0,
 ) -> Optional[Dict[str, Any]]:
     """
     Process frame with fallback to neighboring frames if parsing fails.
 
     Args:
-        cap: Video capture object
+        read_roi: Function returning the ROI image of a frame number, or None
         target_frame: Target frame number
-        roi: ROI coordinates
         fps: Frames per second
         validation_config: Validation configuration with limits
         previous_data: Previous successfully parsed frame data for validation
         max_pause_threshold: Maximum allowed pause duration in seconds
         max_fallback_range: Maximum range to search for fallback frames
+        start_offset: First offset to try; 1 skips the target when it already failed
 
     Returns:
         Parsed data dictionary or None if all attempts failed
     """
     # Try target frame first
-    result = try_parse_frame(cap, target_frame, roi, fps, validation_config, previous_data, max_pause_threshold)
-    if result:
-        return result
+    if start_offset == 0:
+        result = try_parse_frame(read_roi, target_frame, fps, validation_config, previous_data, max_pause_threshold)
+        if result:
+            return result
 
     # Try neighboring frames: +1, -1, +2, -2, ...
-    for offset in range(1, max_fallback_range + 1):
+    for offset in range(max(start_offset, 1), max_fallback_range + 1):
         # Try frame after
         frame_after = target_frame + offset
-        result = try_parse_frame(cap, frame_after, roi, fps, validation_config, previous_data, max_pause_threshold)
+        result = try_parse_frame(read_roi, frame_after, fps, validation_config, previous_data, max_pause_threshold)
         if result:
             result["original_frame"] = target_frame
             result["fallback_offset"] = offset
@@ -314,7 +264,7 @@ def process_frame_with_fallback(
         # Try frame before
         frame_before = target_frame - offset
         if frame_before >= 0:
-            result = try_parse_frame(cap, frame_before, roi, fps, validation_config, previous_data, max_pause_threshold)
+            result = try_parse_frame(read_roi, frame_before, fps, validation_config, previous_data, max_pause_threshold)
             if result:
                 result["original_frame"] = target_frame
                 result["fallback_offset"] = -offset
@@ -329,9 +279,13 @@ def process_full_video(
     output_path: Path,
     frame_interval: int = 10,
     max_fallback_range: int = 5,
+    ocr_workers: int = 1,
 ) -> None:
     """
     Process full video with frame sampling and fallback.
+    With more than one OCR worker, frames are decoded in the calling thread
+    and target frames are OCRed in parallel by a thread pool; fallback frames
+    are only read for targets whose first attempt failed.
 
     Args:
         video_path: Path to video file
@@ -339,6 +293,7 @@ def process_full_video(
         output_path: Path to output JSON file
         frame_interval: Process every Nth frame (default: 10)
         max_fallback_range: Maximum range for fallback frames (default: 5)
+        ocr_workers: Number of target frames OCRed in parallel (default: 1)
     """
     # Load ROI configuration
     config = load_roi_config(config_path)
@@ -352,40 +307,9 @@ def process_full_video(
     print(f"Total frames: {frame_count}")
     print(f"Frame interval: every {frame_interval} frames")
     print(f"Max fallback range: ±{max_fallback_range} frames")
+    print(f"OCR workers: {ocr_workers}")
     print(f"ROI: x={roi['x']}, y={roi['y']}, w={roi['w']}, h={roi['h']}")
     
-    # Open video for time extraction
-    cap_temp = cv2.VideoCapture(str(video_path))
-    if not cap_temp.isOpened():
-        raise ValueError(f"Could not open video: {video_path}")
-    
-    # Extract experiment start and end times
-    print(f"\nExtracting experiment time range...")
-    
-    # Sample frames from different parts of the video to find meaningful start/end times
-    # Start: sample from 5-20% of video (skip very beginning where experiment may not have started)
-    # End: sample from last 5% of video
-    start_sample_frames = [
-        int(frame_count * 0.05 + i * frame_interval) for i in range(5)
-    ]
-    end_sample_frames = [
-        max(frame_count - 1 - i * frame_interval, 0) for i in range(5)
-    ]
-    
-    start_time = extract_time_from_frames(cap_temp, start_sample_frames, roi)
-    end_time = extract_time_from_frames(cap_temp, end_sample_frames, roi)
-    cap_temp.release()
-    
-    # Calculate max pause threshold (75% of experiment duration)
-    max_pause_threshold = None
-    if start_time is not None and end_time is not None and end_time > start_time:
-        experiment_duration = end_time - start_time
-        max_pause_threshold = experiment_duration * 0.75
-        print(f"Experiment time range: {start_time:.0f}s - {end_time:.0f}s (duration: {experiment_duration:.0f}s)")
-        print(f"Max pause threshold: {max_pause_threshold:.0f}s (75% of experiment duration)")
-    else:
-        print(f"Could not extract experiment time range, using default pause detection")
-    
     print(f"\nValidation: Current [{validation_config['current_min']}, {validation_config['current_max']}]A, "
           f"Voltage [{validation_config['voltage_min']}, {validation_config['voltage_max']}]V, "
           f"Time tolerance {validation_config['time_tolerance_sec']}s")
@@ -395,22 +319,23 @@ def process_full_video(
 
     print(f"\nProcessing {len(target_frames)} target frames...")
 
-    # Open video
-    cap = cv2.VideoCapture(str(video_path))
+    # Open video, target frames are increasing so frames are decoded in order
+    cap = open_video_capture(video_path)
     if not cap.isOpened():
         raise ValueError(f"Could not open video: {video_path}")
 
+    # The experiment time range is estimated from the results afterwards, so
+    # it is not known during the pass; it only feeds the time consistency
+    # check, which is disabled
+    max_pause_threshold = None
+
     results: List[Dict[str, Any]] = []
     processed_count = 0
     failed_count = 0
     fallback_used_count = 0
-    previous_result = None
 
-    for idx, target_frame in enumerate(target_frames):
-        # Process frame with fallback, using previous successful frame for validation
-        result = process_frame_with_fallback(
-            cap, target_frame, roi, fps, validation_config, previous_result, max_pause_threshold, max_fallback_range
-        )
+    def handle_result(target_frame: int, result: Optional[Dict[str, Any]]) -> None:
+        nonlocal processed_count, failed_count, fallback_used_count
 
         if result:
             # Check if fallback was used
@@ -425,7 +350,6 @@ def process_full_video(
 
             results.append(result)
             processed_count += 1
-            previous_result = result  # Update previous result for next frame validation
 
             if processed_count % 50 == 0:
                 print(f"  Processed {processed_count}/{len(target_frames)} frames...")
@@ -434,11 +358,110 @@ def process_full_video(
             if failed_count % 10 == 0:
                 print(f"  Failed to parse {failed_count} frames so far...")
 
+    if ocr_workers > 1:
+        # The capture is not thread-safe, so frames are decoded here and the
+        # workers get ROI crops. The first attempt only tries the target and
+        # its direct neighbours, so only those are retrieved and the frames in
+        # between are just grabbed. Targets whose first attempt fails are
+        # retried with the full fallback range, read through a second capture
+        # that seeks to them, so only frames around failures are retrieved.
+        # Targets are validated on their own, as in the serial path
+        reader = SequentialROIReader(cap, roi, history=3, lookbehind=1)
+        window_radius = max_fallback_range + 1
+        fallback_reader = None
+        pending = deque()
+
+        def read_window(source: SequentialROIReader, target_frame: int, radius: int) -> Dict[int, cv2.Mat]:
+            """Read the ROI crops of all frames within radius of the target."""
+            window = {}
+            for frame_num in range(max(target_frame - radius, 0), target_frame + radius + 1):
+                roi_image = source.read(frame_num)
+                if roi_image is not None:
+                    window[frame_num] = roi_image
+            return window
+
+        with ThreadPoolExecutor(max_workers=ocr_workers) as pool:
+
+            def collect(target_frame: int, future: Any, is_fallback: bool) -> None:
+                """Handle a finished attempt, queueing the fallback if the first one failed."""
+                nonlocal fallback_reader
+                result = future.result()
+                if result is not None or is_fallback or max_fallback_range == 0:
+                    handle_result(target_frame, result)
+                    return
+
+                if fallback_reader is None:
+                    fallback_cap = open_video_capture(video_path)
+                    fallback_reader = SequentialROIReader(
+                        fallback_cap, roi, history=2 * window_radius + 1, lookbehind=0,
+                        max_skip=int(fps * 2),
+                    )
+                window = read_window(fallback_reader, target_frame, window_radius)
+                # The target itself was already tried, start at the neighbours
+                future = pool.submit(
+                    process_frame_with_fallback, window.get, target_frame, fps,
+                    validation_config, None, max_pause_threshold, max_fallback_range, 1
+                )
+                pending.append((target_frame, future, True))
+
+            for target_frame in target_frames:
+                window = read_window(reader, target_frame, 1)
+                future = pool.submit(
+                    try_parse_frame, window.get, target_frame, fps,
+                    validation_config, None, max_pause_threshold
+                )
+                pending.append((target_frame, future, False))
+
+                # Collect in submission order, bounding the number of windows in memory
+                if len(pending) >= 4 * ocr_workers:
+                    collect(*pending.popleft())
+
+            while pending:
+                collect(*pending.popleft())
+
+        if fallback_reader is not None:
+            fallback_reader.cap.release()
+    else:
+        # Fallback tries frames up to ±(max_fallback_range + 1) around the target,
+        # keep enough crops that none of them needs a seek; frames further before
+        # a target are never tried, so they are skipped without retrieving
+        reader = SequentialROIReader(
+            cap, roi, history=2 * max_fallback_range + 4, lookbehind=max_fallback_range + 1
+        )
+        for target_frame in target_frames:
+            # Targets are validated on their own so the result does not depend
+            # on the number of workers; the time consistency check that would
+            # use the previous result is disabled
+            result = process_frame_with_fallback(
+                reader.read, target_frame, fps, validation_config, None,
+                max_pause_threshold, max_fallback_range
+            )
+            handle_result(target_frame, result)
+
     cap.release()
 
     # Sort results by frame number
     results.sort(key=lambda x: x["frame"])
 
+    # Estimate experiment start and end times from the parsed results
+    # Start: first samples from 5% of video (skip very beginning where experiment may not have started)
+    # End: last samples of the video
+    start_frame = int(frame_count * 0.05)
+    start_times = [r["time_sec"] for r in results if r["frame"] >= start_frame][:5]
+    end_times = [r["time_sec"] for r in results[-5:]]
+    # Median to avoid outliers
+    start_time = float(np.median(start_times)) if start_times else None
+    end_time = float(np.median(end_times)) if end_times else None
+
+    # Calculate max pause threshold (75% of experiment duration)
+    if start_time is not None and end_time is not None and end_time > start_time:
+        experiment_duration = end_time - start_time
+        max_pause_threshold = experiment_duration * 0.75
+        print(f"\nExperiment time range: {start_time:.0f}s - {end_time:.0f}s (duration: {experiment_duration:.0f}s)")
+        print(f"Max pause threshold: {max_pause_threshold:.0f}s (75% of experiment duration)")
+    else:
+        print(f"\nCould not extract experiment time range")
+
     # Save results
     output_data = {
         "video": video_path.name,
@@ -457,8 +480,7 @@ def process_full_video(
     }
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        json.dump(output_data, f, indent=2)
+    save_json(output_path, output_data)
 
     print(f"\nProcessing complete!")
     print(f"  Target frames processed: {len(target_frames)}")
@@ -496,6 +518,7 @@ def run_extract() -> None:
             output_path,
             frame_interval=10,
             max_fallback_range=5,
+            ocr_workers=min(os.cpu_count() or 1, 8),
         )
         print("\nExtract completed successfully!")
     except Exception as e:
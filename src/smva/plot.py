@@ -1,12 +1,14 @@
 """Plot: Plot graphs from extracted data."""
 
-import json
+from itertools import chain
 from pathlib import Path
 from typing import List, Dict, Any
 
 import matplotlib.pyplot as plt
 import numpy as np
 
+from smva.utils.jsonio import load_json, save_json
+
 
 def load_output_data(output_path: Path) -> Dict[str, Any]:
     """
@@ -21,8 +23,7 @@ def load_output_data(output_path: Path) -> Dict[str, Any]:
     if not output_path.exists():
         raise FileNotFoundError(f"Output file not found: {output_path}")
 
-    with open(output_path, "r") as f:
-        data = json.load(f)
+    data = load_json(output_path)
 
     if "data" not in data:
         raise ValueError("Invalid output file format: missing 'data' key")
@@ -43,48 +44,41 @@ def plot_graphs(data: Dict[str, Any], output_path: Path) -> None:
     if not video_data:
         raise ValueError("No data to plot")
 
-    # Extract data and filter invalid points
+    # Extract all points in a single pass into one (N, 4) array
+    # Use time_sec_precise if available, otherwise fall back to time_sec
+    original_count = len(video_data)
+    values = chain.from_iterable(
+        (
+            item.get("time_sec_precise", item["time_sec"]),
+            item["current_A"],
+            item["mps_V"],
+            item["mag_V"],
+        )
+        for item in video_data
+    )
+    series = np.fromiter(values, dtype=np.float64, count=original_count * 4)
+    series = series.reshape(original_count, 4)
+
+    # Filter invalid points
     # Physical limits:
     # Current: -10A to 600A
     # Voltages: -10V to 12V
-    filtered_data = []
-    filtered_indices = []
-    for idx, item in enumerate(video_data):
-        current_a = item["current_A"]
-        mps_v = item["mps_V"]
-        mag_v = item["mag_V"]
-        
-        # Skip points with invalid values
-        if current_a < -10.0 or current_a > 600.0:
-            continue
-        if mps_v < -10.0 or mps_v > 12.0:
-            continue
-        if mag_v < -10.0 or mag_v > 12.0:
-            continue
-        
-        filtered_data.append(item)
-        filtered_indices.append(idx)
+    invalid = (series[:, 1] < -10.0) | (series[:, 1] > 600.0)
+    invalid |= (series[:, 2] < -10.0) | (series[:, 2] > 12.0)
+    invalid |= (series[:, 3] < -10.0) | (series[:, 3] > 12.0)
+    filtered_indices = np.flatnonzero(~invalid)
     
-    if not filtered_data:
+    if len(filtered_indices) == 0:
         raise ValueError("No valid data points after filtering")
     
     # Report filtering statistics
-    original_count = len(video_data)
-    filtered_count = len(filtered_data)
+    filtered_count = len(filtered_indices)
     skipped_count = original_count - filtered_count
     if skipped_count > 0:
         print(f"Filtered out {skipped_count} invalid data points ({filtered_count}/{original_count} valid)")
     
-    # Extract filtered data
-    # Use time_sec_precise if available, otherwise fall back to time_sec
-    time_sec = np.array([
-        item.get("time_sec_precise", item["time_sec"]) 
-        for item in filtered_data
-    ])
-    current_a = np.array([item["current_A"] for item in filtered_data])
-    mps_v = np.array([item["mps_V"] for item in filtered_data])
-    mag_v = np.array([item["mag_V"] for item in filtered_data])
-    filtered_indices = np.array(filtered_indices)
+    series = series[filtered_indices]
+    time_sec, current_a, mps_v, mag_v = series.T
     
     # Additional filtering: remove spikes and outliers
     if len(current_a) > 2:
@@ -94,24 +88,18 @@ def plot_graphs(data: Dict[str, Any], output_path: Path) -> None:
         # This catches OCR errors that cause time to jump incorrectly
         dt = np.diff(time_sec)
         max_time_jump = 300.0  # Maximum allowed time jump in seconds (5 minutes)
-        time_jump_filtered = 0
         
-        for i in range(len(dt)):
-            # Remove points where time goes backwards significantly
-            if dt[i] < -10.0:  # Time goes backwards more than 10 seconds
-                valid_mask[i + 1] = False
-                time_jump_filtered += 1
-            # Remove points where time jumps forward too much (likely OCR error)
-            elif dt[i] > max_time_jump:
-                valid_mask[i + 1] = False
-                time_jump_filtered += 1
+        # Remove points where time goes backwards more than 10 seconds
+        # or jumps forward too much (likely OCR error)
+        bad_jump = (dt < -10.0) | (dt > max_time_jump)
+        valid_mask[1:] &= ~bad_jump
+        time_jump_filtered = int(bad_jump.sum())
         
         if time_jump_filtered > 0:
             print(f"Filtered out {time_jump_filtered} points with invalid time jumps")
         
         # Filter 1: Remove points with excessive rate of change
         # This catches sudden spikes
-        dt = np.diff(time_sec)
         dt = np.where(dt == 0, 1.0, dt)  # Avoid division by zero
         
         current_diff = np.abs(np.diff(current_a)) / dt
@@ -122,59 +110,33 @@ def plot_graphs(data: Dict[str, Any], output_path: Path) -> None:
         max_current_rate = 500.0  # A/s (increased from 50.0 to preserve rapid ramps)
         max_voltage_rate = 50.0   # V/s (increased from 5.0 to preserve rapid changes)
         
-        for i in range(len(current_diff)):
-            if current_diff[i] > max_current_rate or \
-               mps_diff[i] > max_voltage_rate or \
-               mag_diff[i] > max_voltage_rate:
-                valid_mask[i + 1] = False
+        valid_mask[1:] &= ~(
+            (current_diff > max_current_rate) |
+            (mps_diff > max_voltage_rate) |
+            (mag_diff > max_voltage_rate)
+        )
         
         # Filter 2: Remove isolated outliers (points that differ significantly from neighbors on both sides)
         # This catches single-point spikes that might pass rate-of-change filter
-        for i in range(1, len(current_a) - 1):
-            if not valid_mask[i]:
-                continue
-            
-            # Check if current point is an outlier compared to neighbors
-            prev_current = current_a[i - 1]
-            curr_current = current_a[i]
-            next_current = current_a[i + 1]
-            
-            prev_mps = mps_v[i - 1]
-            curr_mps = mps_v[i]
-            next_mps = mps_v[i + 1]
-            
-            prev_mag = mag_v[i - 1]
-            curr_mag = mag_v[i]
-            next_mag = mag_v[i + 1]
-            
-            # Calculate if current point is isolated (differs from both neighbors)
-            # Increased thresholds to preserve real rapid transitions in MRI ramp data
-            current_is_isolated = (
-                abs(curr_current - prev_current) > 200 and
-                abs(curr_current - next_current) > 200 and
-                abs(prev_current - next_current) < 100  # Neighbors are similar
-            )
-            
-            mps_is_isolated = (
-                abs(curr_mps - prev_mps) > 5.0 and
-                abs(curr_mps - next_mps) > 5.0 and
-                abs(prev_mps - next_mps) < 2.0  # Neighbors are similar
-            )
-            
-            mag_is_isolated = (
-                abs(curr_mag - prev_mag) > 5.0 and
-                abs(curr_mag - next_mag) > 5.0 and
-                abs(prev_mag - next_mag) < 2.0  # Neighbors are similar
+        def is_isolated(values: np.ndarray, jump: float, spread: float) -> np.ndarray:
+            """Mark inner points that differ from both neighbors while the neighbors are similar."""
+            prev, curr, nxt = values[:-2], values[1:-1], values[2:]
+            return (
+                (np.abs(curr - prev) > jump) &
+                (np.abs(curr - nxt) > jump) &
+                (np.abs(prev - nxt) < spread)  # Neighbors are similar
             )
-            
-            if current_is_isolated or mps_is_isolated or mag_is_isolated:
-                valid_mask[i] = False
+
+        # Increased thresholds to preserve real rapid transitions in MRI ramp data
+        isolated = (
+            is_isolated(current_a, 200, 100) |
+            is_isolated(mps_v, 5.0, 2.0) |
+            is_isolated(mag_v, 5.0, 2.0)
+        )
+        valid_mask[1:-1] &= ~isolated
         
-        # Apply mask
-        time_sec = time_sec[valid_mask]
-        current_a = current_a[valid_mask]
-        mps_v = mps_v[valid_mask]
-        mag_v = mag_v[valid_mask]
+        # Apply combined mask to all columns at once
+        time_sec, current_a, mps_v, mag_v = series[valid_mask].T
         filtered_indices = filtered_indices[valid_mask]
         
         rate_filtered_count = np.sum(~valid_mask)
@@ -204,32 +166,27 @@ def plot_graphs(data: Dict[str, Any], output_path: Path) -> None:
     #     mag_v = median_filter(mag_v, window_size=window_size)
     #     print(f"Applied median filter (window size: {window_size})")
     
-    # Convert back to lists for plotting
-    time_sec = time_sec.tolist()
-    current_a = current_a.tolist()
-    mps_v = mps_v.tolist()
-    mag_v = mag_v.tolist()
+    # Calculate time strings from seconds (use precise time)
+    total_minutes, seconds = np.divmod(time_sec.astype(np.int64), 60)
+    hours, minutes = np.divmod(total_minutes, 60)
+    time_strs = [
+        f"{h:02d}:{m:02d}:{s:02d}"
+        for h, m, s in zip(hours.tolist(), minutes.tolist(), seconds.tolist())
+    ]
     
     # Prepare cleaned data for saving
+    originals = [video_data[idx] for idx in filtered_indices.tolist()]
     cleaned_data = []
-    for i in range(len(time_sec)):
-        # Get original data point
-        original_idx = int(filtered_indices[i])
-        original_item = video_data[original_idx]
-        
-        # Calculate time string from seconds (use precise time)
-        total_seconds = int(time_sec[i])
-        hours = total_seconds // 3600
-        minutes = (total_seconds % 3600) // 60
-        seconds = total_seconds % 60
-        time_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        
+    # Values are converted to Python floats for JSON serialization
+    for t, c, mps, mag, time_str, original_item in zip(
+        time_sec.tolist(), current_a.tolist(), mps_v.tolist(), mag_v.tolist(), time_strs, originals
+    ):
         # Build cleaned item with all original fields plus filtered values
         cleaned_item = {
-            "time_sec": time_sec[i],
-            "current_A": current_a[i],
-            "mps_V": mps_v[i],
-            "mag_V": mag_v[i],
+            "time_sec": t,
+            "current_A": c,
+            "mps_V": mps,
+            "mag_V": mag,
             "time": time_str
         }
         
@@ -295,7 +252,7 @@ def plot_graphs(data: Dict[str, Any], output_path: Path) -> None:
 
     # Save plot
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    plt.savefig(output_path, dpi=300, bbox_inches="tight")
+    plt.savefig(output_path, dpi=150, bbox_inches="tight")
     print(f"Graph saved to: {output_path}")
 
     # Save cleaned data to JSON
@@ -310,8 +267,7 @@ def plot_graphs(data: Dict[str, Any], output_path: Path) -> None:
         "data": cleaned_data
     }
     
-    with open(cleaned_output_path, "w") as f:
-        json.dump(cleaned_output_data, f, indent=2)
+    save_json(cleaned_output_path, cleaned_output_data)
     print(f"Cleaned data saved to: {cleaned_output_path}")
 
     # Also show the plot
@@ -6,7 +6,7 @@ from tkinter import filedialog
 from pathlib import Path
 from typing import Optional, Tuple
 
-from smva.utils.video import get_video_metadata, extract_preview_frames, load_frame
+from smva.utils.video import get_video_metadata, extract_preview_frames
 from smva.utils.roi import save_roi_config
 
 
@@ -149,7 +149,9 @@ def run_setup_roi() -> None:
     output_dir = Path("result/frames_preview")
     print(f"\nExtracting 5 preview frames to {output_dir}...")
     try:
-        preview_frames = extract_preview_frames(video_path, output_dir, num_frames=5)
+        preview_frames = extract_preview_frames(
+            video_path, output_dir, num_frames=5, frame_count=frame_count
+        )
         print(f"Extracted {len(preview_frames)} preview frames")
     except Exception as e:
         print(f"Error extracting preview frames: {e}")
@@ -7,9 +7,9 @@ from tkinter import filedialog
 from pathlib import Path
 from typing import List, Dict, Any, Optional
 
-from smva.utils.video import get_video_metadata
+from smva.utils.video import get_video_metadata, open_video_capture
 from smva.utils.roi import load_roi_config
-from smva.utils.ocr import extract_text_from_roi, parse_mri_data, time_string_to_seconds
+from smva.utils.ocr import extract_text_from_rois, parse_mri_data, time_string_to_seconds
 
 
 def select_video_file() -> Optional[Path]:
@@ -37,7 +37,9 @@ def select_video_file() -> Optional[Path]:
     return None
 
 
-def process_test_frames(video_path: Path, config_path: Path, num_frames: int = 5) -> None:
+def process_test_frames(
+    video_path: Path, config_path: Path, num_frames: int = 5, save_full_frame: bool = False
+) -> None:
     """
     Process test frames with OCR for verification.
     Extracts evenly spaced frames and displays results.
@@ -46,6 +48,7 @@ def process_test_frames(video_path: Path, config_path: Path, num_frames: int = 5
         video_path: Path to video file
         config_path: Path to ROI config file
         num_frames: Number of test frames to extract
+        save_full_frame: Also save the full frame with the ROI rectangle marked
     """
     # Load ROI configuration
     config = load_roi_config(config_path)
@@ -70,7 +73,7 @@ def process_test_frames(video_path: Path, config_path: Path, num_frames: int = 5
     test_frames_dir.mkdir(parents=True, exist_ok=True)
 
     # Open video
-    cap = cv2.VideoCapture(str(video_path))
+    cap = open_video_capture(video_path)
     if not cap.isOpened():
         raise ValueError(f"Could not open video: {video_path}")
 
@@ -80,7 +83,9 @@ def process_test_frames(video_path: Path, config_path: Path, num_frames: int = 5
     print(f"{'Frame':<10} {'Time':<12} {'Current (A)':<15} {'MPS (V)':<12} {'MAG (V)':<12} {'Status':<10}")
     print("=" * 70)
 
-    for idx, frame_num in enumerate(frame_indices):
+    # Read and save all test frames first, then OCR them in parallel
+    crops = []
+    for frame_num in frame_indices:
         # Seek to frame
         cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
         ret, frame = cap.read()
@@ -89,22 +94,29 @@ def process_test_frames(video_path: Path, config_path: Path, num_frames: int = 5
             print(f"Frame {frame_num:<10} {'ERROR':<12} {'Could not read frame':<15}")
             continue
 
-        # Crop ROI
-        roi_image = frame[y : y + h, x : x + w]
+        # Crop ROI (copied, the rectangle below is drawn on the frame in place)
+        roi_image = frame[y : y + h, x : x + w].copy()
 
         # Save ROI image for verification
         roi_image_path = test_frames_dir / f"frame_{frame_num:06d}_roi.jpg"
         cv2.imwrite(str(roi_image_path), roi_image)
 
-        # Also save full frame with ROI rectangle marked
-        frame_with_roi = frame.copy()
-        cv2.rectangle(frame_with_roi, (x, y), (x + w, y + h), (0, 255, 0), 2)
-        full_frame_path = test_frames_dir / f"frame_{frame_num:06d}_full.jpg"
-        cv2.imwrite(str(full_frame_path), frame_with_roi)
+        # Optionally save full frame with ROI rectangle marked
+        # (drawn in place, the frame is not used after this)
+        full_frame_path = None
+        if save_full_frame:
+            cv2.rectangle(frame, (x, y), (x + w, y + h), (0, 255, 0), 2)
+            full_frame_path = test_frames_dir / f"frame_{frame_num:06d}_full.jpg"
+            cv2.imwrite(str(full_frame_path), frame)
 
-        # Perform OCR
-        text = extract_text_from_roi(roi_image)
+        crops.append((frame_num, roi_image, roi_image_path, full_frame_path))
 
+    cap.release()
+
+    # Perform OCR
+    texts = extract_text_from_rois([roi_image for _, roi_image, _, _ in crops])
+
+    for (frame_num, _, roi_image_path, full_frame_path), text in zip(crops, texts):
         # Parse data
         parsed_data = parse_mri_data(text)
 
@@ -124,7 +136,7 @@ def process_test_frames(video_path: Path, config_path: Path, num_frames: int = 5
                 "time": parsed_data["time"],
                 "status": skip_status,
                 "roi_image": str(roi_image_path),
-                "full_frame": str(full_frame_path),
+                "full_frame": str(full_frame_path) if full_frame_path else None,
             }
 
             results.append(result)
@@ -141,8 +153,6 @@ def process_test_frames(video_path: Path, config_path: Path, num_frames: int = 5
         else:
             print(f"{frame_num:<10} {'FAILED':<12} {'OCR parsing failed':<15}")
 
-    cap.release()
-
     print("=" * 70)
     print(f"\nTest Results Summary:")
     print(f"  Total test frames: {num_frames}")
@@ -163,11 +173,16 @@ def process_test_frames(video_path: Path, config_path: Path, num_frames: int = 5
         print(f"  MAG VOLTS: {result['mag_V']:.4f} V")
         print(f"  Status: {result['status']}")
         print(f"  ROI image: {result.get('roi_image', 'N/A')}")
-        print(f"  Full frame: {result.get('full_frame', 'N/A')}")
+        print(f"  Full frame: {result.get('full_frame') or 'N/A'}")
 
 
-def run_test_ocr() -> None:
-    """Run Test OCR: Test OCR processing on sample frames."""
+def run_test_ocr(save_full_frame: bool = False) -> None:
+    """
+    Run Test OCR: Test OCR processing on sample frames.
+
+    Args:
+        save_full_frame: Also save full frames with the ROI rectangle marked
+    """
     print("Test OCR: Test OCR Processing")
     print("=" * 50)
 
@@ -186,7 +201,9 @@ def run_test_ocr() -> None:
 
     # Process test frames
     try:
-        process_test_frames(video_path, config_path, num_frames=5)
+        process_test_frames(
+            video_path, config_path, num_frames=5, save_full_frame=save_full_frame
+        )
         print("\nTest OCR completed successfully!")
     except Exception as e:
         print(f"Error processing video: {e}")
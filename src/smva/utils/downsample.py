@@ -0,0 +1,149 @@
+"""Downsampling utilities for plotting large time series."""
+
+from typing import Sequence
+
+import numpy as np
+
+try:
+    from tsdownsample import MinMaxLTTBDownsampler
+except ImportError:  # tsdownsample is optional, fall back to the NumPy implementation
+    MinMaxLTTBDownsampler = None
+
+
+def minmax_indices(series: Sequence[np.ndarray], n_buckets: int) -> np.ndarray:
+    """
+    Select indices of the minimum and maximum of every bucket.
+    Data is split into n_buckets equal index ranges (one per pixel column),
+    and the extrema of each series in each range are kept, so spikes stay
+    visible and the number of plotted points does not depend on data size.
+
+    Args:
+        series: One or more equally long 1-D arrays sharing the same x values
+        n_buckets: Number of buckets (typically the plot width in pixels)
+
+    Returns:
+        Sorted array of selected indices, shared by all series
+    """
+    n = len(series[0])
+    if n_buckets <= 0 or n <= 2 * n_buckets:
+        return np.arange(n)
+
+    bucket_size = n // n_buckets
+    full = bucket_size * n_buckets
+    offsets = np.arange(n_buckets) * bucket_size
+
+    selected = [np.array([0, n - 1])]
+    for y in series:
+        buckets = y[:full].reshape(n_buckets, bucket_size)
+        selected.append(offsets + buckets.argmin(axis=1))
+        selected.append(offsets + buckets.argmax(axis=1))
+        if full < n:
+            tail = y[full:]
+            selected.append(np.array([full + tail.argmin(), full + tail.argmax()]))
+
+    return np.unique(np.concatenate(selected))
+
+
+def lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Select indices with the Largest-Triangle-Three-Buckets algorithm.
+    First and last points are always kept. The points in between are split
+    into n_out - 2 buckets, and from each bucket the point forming the
+    largest triangle with the previously selected point and the average of
+    the next bucket is kept. This preserves the visual shape of the signal.
+
+    Args:
+        x: Monotonically increasing x values
+        y: Y values
+        n_out: Number of points to select
+
+    Returns:
+        Sorted array of n_out selected indices
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return np.arange(n)
+
+    n_buckets = n_out - 2
+    edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+
+    # Average point of every bucket, the last point acts as the bucket after the last one
+    counts = np.diff(edges)
+    avg_x = np.append(np.add.reduceat(x[1 : n - 1], edges[:-1] - 1) / counts, x[n - 1])
+    avg_y = np.append(np.add.reduceat(y[1 : n - 1], edges[:-1] - 1) / counts, y[n - 1])
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    a = 0
+    for i in range(n_buckets):
+        start, end = edges[i], edges[i + 1]
+        ax, ay = x[a], y[a]
+        area = np.abs(
+            (ax - avg_x[i + 1]) * (y[start:end] - ay) - (ax - x[start:end]) * (avg_y[i + 1] - ay)
+        )
+        a = start + int(area.argmax())
+        indices[i + 1] = a
+
+    return indices
+
+
+def minmax_lttb_indices(
+    x: np.ndarray, y: np.ndarray, n_out: int, minmax_ratio: int = 4
+) -> np.ndarray:
+    """
+    Select indices with MinMaxLTTB.
+    Min/max preselection first reduces the data to about n_out * minmax_ratio
+    candidate points, then LTTB picks n_out of them. The result is visually
+    close to plain LTTB, but the expensive LTTB pass no longer depends on
+    data size. Uses tsdownsample when it is installed.
+
+    Args:
+        x: Monotonically increasing x values
+        y: Y values
+        n_out: Number of points to select
+        minmax_ratio: Number of preselected candidates per output point
+
+    Returns:
+        Sorted array of selected indices
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return np.arange(n)
+
+    if MinMaxLTTBDownsampler is not None:
+        # tsdownsample only accepts contiguous arrays, column views are strided
+        indices = MinMaxLTTBDownsampler().downsample(
+            np.ascontiguousarray(x), np.ascontiguousarray(y), n_out=n_out, minmax_ratio=minmax_ratio
+        )
+        return indices.astype(np.int64)
+
+    candidates = minmax_indices((y,), n_out * minmax_ratio // 2)
+    if len(candidates) <= n_out:
+        return candidates
+    return candidates[lttb_indices(x[candidates], y[candidates], n_out)]
+
+
+def minmax_lttb_union_indices(
+    x: np.ndarray, series: Sequence[np.ndarray], n_out: int, minmax_ratio: int = 4
+) -> np.ndarray:
+    """
+    Select indices with MinMaxLTTB for several series sharing the same x values.
+    Every series is downsampled on its own to an equal share of n_out and
+    the union of the selected indices is returned, so a spike in one series
+    is kept even when it falls between the points selected for the others.
+
+    Args:
+        x: Monotonically increasing x values
+        series: One or more y arrays as long as x
+        n_out: Total number of points to select (at least 3 per series)
+        minmax_ratio: Number of preselected candidates per output point
+
+    Returns:
+        Sorted array of selected indices, shared by all series
+    """
+    n_per_series = max(n_out // len(series), 3)
+    return np.unique(
+        np.concatenate([minmax_lttb_indices(x, y, n_per_series, minmax_ratio) for y in series])
+    )
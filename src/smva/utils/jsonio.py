@@ -0,0 +1,45 @@
+"""JSON reading and writing utilities."""
+
+import json
+from pathlib import Path
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the standard library
+    orjson = None
+
+
+def load_json(path: Path) -> Any:
+    """
+    Load JSON document from file.
+    Uses orjson when it is installed, otherwise the standard json module.
+
+    Args:
+        path: Path to JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+
+    # Bytes input lets json detect the encoding, orjson writes UTF-8
+    return json.loads(path.read_bytes())
+
+
+def save_json(path: Path, data: Any) -> None:
+    """
+    Save JSON document to file, indented by 2 spaces.
+    Uses orjson when it is installed, otherwise the standard json module.
+
+    Args:
+        path: Path to JSON file
+        data: JSON-serializable document
+    """
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
@@ -1,11 +1,26 @@
 """OCR processing utilities."""
 
+import hashlib
 import re
 import os
+import threading
 import pytesseract
 import cv2
 import numpy as np
-from typing import Optional, Dict, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Sequence
+
+# OCR runs several Tesseract calls in parallel, so each is limited to one
+# OpenMP thread. libgomp reads this when tesserocr loads it below, and the
+# Tesseract processes started by pytesseract inherit it
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    import tesserocr
+except ImportError:  # tesserocr is optional, fall back to pytesseract
+    tesserocr = None
 
 # Configure Tesseract path for Windows
 if os.name == "nt":  # Windows
@@ -13,11 +28,46 @@ if os.name == "nt":  # Windows
     if os.path.exists(tesseract_path):
         pytesseract.pytesseract.tesseract_cmd = tesseract_path
 
+# Tesseract API instances are not thread-safe, each thread keeps its own.
+# A thread's API is dropped with the thread when its worker pool shuts down,
+# and tesserocr's deallocator calls End() on it, so nothing is released here
+_tesserocr_local = threading.local()
+# Set once creating an API failed (e.g. missing tessdata), OCR then goes
+# through pytesseract instead of failing on every image
+_tesserocr_failed = False
+_tesserocr_failed_lock = threading.Lock()
+
+# OCR results of recent ROI images keyed by (shape, content digest). The
+# overlay changes about once per second, so sampled frames often repeat it
+OCR_CACHE_SIZE = 256
+_ocr_cache: OrderedDict = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+# Patterns for parse_mri_data, compiled once
+# Current: "ACTUAL CURRENT" followed by number and "A"
+_CURRENT_RE = re.compile(r"ACTUAL\s+CURRENT.*?([\d.]+)\s*A", re.IGNORECASE)
+# MPS volts: "MPS VOLTS" followed by optional sign, number and "V"
+_MPS_RE = re.compile(r"MPS\s+VOLTS.*?([+-]?[\d.]+)\s*V", re.IGNORECASE)
+# MAG volts: "MAG VOLTS" followed by optional sign, number and "V"
+_MAG_RE = re.compile(r"MAG\s+VOLTS.*?([+-]?[\d.]+)\s*V", re.IGNORECASE)
+# Time: "Elapsed Time" followed by hh:mm:ss
+_TIME_RE = re.compile(r"Elapsed\s+Time.*?(\d{2}:\d{2}:\d{2})", re.IGNORECASE)
+# Simpler per-line patterns: numbers with units, or a bare hh:mm:ss
+_AMPS_VALUE_RE = re.compile(r"([\d.]+)\s*A", re.IGNORECASE)
+_VOLTS_VALUE_RE = re.compile(r"([+-]?[\d.]+)\s*V", re.IGNORECASE)
+_TIME_VALUE_RE = re.compile(r"(\d{2}:\d{2}:\d{2})")
+
+# ROIs taller than this are shrunk before preprocessing; the four text lines
+# then stay around 50 px high, which is plenty for Tesseract
+MAX_OCR_HEIGHT = 200
+
 
 def preprocess_image_for_ocr(image: cv2.Mat) -> cv2.Mat:
     """
     Preprocess image to improve OCR accuracy.
     Removes green artifacts (like the running green square indicator) that can interfere with OCR.
+    Images taller than MAX_OCR_HEIGHT are downscaled first, which makes the
+    denoising and OCR steps cheaper on high resolution videos.
 
     Args:
         image: Input image
@@ -25,6 +75,10 @@ def preprocess_image_for_ocr(image: cv2.Mat) -> cv2.Mat:
     Returns:
         Preprocessed image
     """
+    if image.shape[0] > MAX_OCR_HEIGHT:
+        scale = MAX_OCR_HEIGHT / image.shape[0]
+        image = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
     # If image is color, remove green artifacts first (like the running green square indicator)
     if len(image.shape) == 3:
         # Convert BGR to HSV for better color detection
@@ -52,13 +106,16 @@ def preprocess_image_for_ocr(image: cv2.Mat) -> cv2.Mat:
         # Convert to grayscale
         gray = cv2.cvtColor(result, cv2.COLOR_BGR2GRAY)
     else:
-        gray = image.copy()
+        # Thresholding below writes to a new image, no copy needed
+        gray = image
 
     # Apply thresholding
     _, thresh = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
 
     # Optional: denoise
-    denoised = cv2.fastNlMeansDenoising(thresh, None, 10, 7, 21)
+    # Median blur removes salt-and-pepper pixels from the binary image,
+    # non-local means is meant for grayscale noise and is far slower
+    denoised = cv2.medianBlur(thresh, 3)
     
     # Additional morphological operations to remove small artifacts
     # Remove small noise while preserving text
@@ -68,9 +125,40 @@ def preprocess_image_for_ocr(image: cv2.Mat) -> cv2.Mat:
     return cleaned
 
 
+def _get_tesserocr_api() -> Optional[Any]:
+    """
+    Get the tesserocr API of the current thread, creating it on first use.
+    Every pytesseract call starts a Tesseract process that loads the
+    language model again; a kept API instance loads it once per thread.
+
+    Returns:
+        tesserocr.PyTessBaseAPI instance configured like "--psm 6", or None
+        if tesserocr is not installed or could not be initialized
+    """
+    global _tesserocr_failed
+    if tesserocr is None or _tesserocr_failed:
+        return None
+
+    api = getattr(_tesserocr_local, "api", None)
+    if api is None:
+        try:
+            api = tesserocr.PyTessBaseAPI(psm=tesserocr.PSM.SINGLE_BLOCK)
+        except RuntimeError as e:
+            with _tesserocr_failed_lock:
+                if not _tesserocr_failed:
+                    _tesserocr_failed = True
+                    print(f"Warning: could not initialize tesserocr ({e}), using pytesseract")
+            return None
+        _tesserocr_local.api = api
+    return api
+
+
 def extract_text_from_roi(roi_image: cv2.Mat) -> str:
     """
     Extract text from ROI image using OCR.
+    Uses an in-process Tesseract API via tesserocr when it is installed and
+    initializes, otherwise the pytesseract command line wrapper. Images identical to a
+    recently processed one reuse its text without running OCR again.
 
     Args:
         roi_image: Cropped ROI image
@@ -78,11 +166,53 @@ def extract_text_from_roi(roi_image: cv2.Mat) -> str:
     Returns:
         Extracted text string
     """
+    digest = hashlib.blake2b(np.ascontiguousarray(roi_image), digest_size=16).digest()
+    key = (roi_image.shape, digest)
+    with _ocr_cache_lock:
+        text = _ocr_cache.get(key)
+        if text is not None:
+            _ocr_cache.move_to_end(key)
+            return text
+
     processed = preprocess_image_for_ocr(roi_image)
-    text = pytesseract.image_to_string(processed, config="--psm 6")
+
+    api = _get_tesserocr_api()
+    if api is not None:
+        height, width = processed.shape
+        api.SetImageBytes(processed.tobytes(), width, height, 1, width)
+        text = api.GetUTF8Text()
+    else:
+        text = pytesseract.image_to_string(processed, config="--psm 6")
+
+    with _ocr_cache_lock:
+        _ocr_cache[key] = text
+        if len(_ocr_cache) > OCR_CACHE_SIZE:
+            _ocr_cache.popitem(last=False)
+
     return text
 
 
+def extract_text_from_rois(
+    roi_images: Sequence[cv2.Mat], max_workers: Optional[int] = None
+) -> List[str]:
+    """
+    Extract text from several ROI images at once.
+    Every pytesseract call runs its own Tesseract process, so the images are
+    processed by a thread pool. This module limits Tesseract's OpenMP threading
+    to one thread (OMP_THREAD_LIMIT) so the parallel calls do not
+    oversubscribe the CPU.
+
+    Args:
+        roi_images: Cropped ROI images
+        max_workers: Maximum number of parallel OCR calls (default: thread pool default)
+
+    Returns:
+        Extracted text strings in the order of the images
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(extract_text_from_roi, roi_images))
+
+
 def parse_mri_data(text: str) -> Optional[Dict[str, Any]]:
     """
     Parse four values from OCR text in fixed order:
@@ -105,22 +235,13 @@ def parse_mri_data(text: str) -> Optional[Dict[str, Any]]:
     mag_v = None
     time_str = None
 
-    # Pattern for current: "ACTUAL CURRENT" followed by number and "A"
-    current_pattern = r"ACTUAL\s+CURRENT.*?([\d.]+)\s*A"
-    # Pattern for MPS volts: "MPS VOLTS" followed by optional sign, number and "V"
-    mps_pattern = r"MPS\s+VOLTS.*?([+-]?[\d.]+)\s*V"
-    # Pattern for MAG volts: "MAG VOLTS" followed by optional sign, number and "V"
-    mag_pattern = r"MAG\s+VOLTS.*?([+-]?[\d.]+)\s*V"
-    # Pattern for time: "Elapsed Time" followed by hh:mm:ss
-    time_pattern = r"Elapsed\s+Time.*?(\d{2}:\d{2}:\d{2})"
-
     full_text = " ".join(lines)
 
     # Search for patterns
-    current_match = re.search(current_pattern, full_text, re.IGNORECASE)
-    mps_match = re.search(mps_pattern, full_text, re.IGNORECASE)
-    mag_match = re.search(mag_pattern, full_text, re.IGNORECASE)
-    time_match = re.search(time_pattern, full_text, re.IGNORECASE)
+    current_match = _CURRENT_RE.search(full_text)
+    mps_match = _MPS_RE.search(full_text)
+    mag_match = _MAG_RE.search(full_text)
+    time_match = _TIME_RE.search(full_text)
 
     if current_match:
         try:
@@ -147,9 +268,11 @@ def parse_mri_data(text: str) -> Optional[Dict[str, Any]]:
     if not all([current_a is not None, mps_v is not None, mag_v is not None, time_str]):
         # Try simpler patterns - look for numbers with units
         for line in lines:
+            upper = line.upper()
+
             # Current
-            if "CURRENT" in line.upper() and current_a is None:
-                match = re.search(r"([\d.]+)\s*A", line, re.IGNORECASE)
+            if current_a is None and "CURRENT" in upper:
+                match = _AMPS_VALUE_RE.search(line)
                 if match:
                     try:
                         current_a = float(match.group(1))
@@ -157,8 +280,8 @@ def parse_mri_data(text: str) -> Optional[Dict[str, Any]]:
                         pass
 
             # MPS
-            if "MPS" in line.upper() and mps_v is None:
-                match = re.search(r"([+-]?[\d.]+)\s*V", line, re.IGNORECASE)
+            if mps_v is None and "MPS" in upper:
+                match = _VOLTS_VALUE_RE.search(line)
                 if match:
                     try:
                         mps_v = float(match.group(1))
@@ -166,8 +289,8 @@ def parse_mri_data(text: str) -> Optional[Dict[str, Any]]:
                         pass
 
             # MAG
-            if "MAG" in line.upper() and mag_v is None:
-                match = re.search(r"([+-]?[\d.]+)\s*V", line, re.IGNORECASE)
+            if mag_v is None and "MAG" in upper:
+                match = _VOLTS_VALUE_RE.search(line)
                 if match:
                     try:
                         mag_v = float(match.group(1))
@@ -175,11 +298,15 @@ def parse_mri_data(text: str) -> Optional[Dict[str, Any]]:
                         pass
 
             # Time
-            if "TIME" in line.upper() and time_str is None:
-                match = re.search(r"(\d{2}:\d{2}:\d{2})", line)
+            if time_str is None and "TIME" in upper:
+                match = _TIME_VALUE_RE.search(line)
                 if match:
                     time_str = match.group(1)
 
+            # Stop scanning once all values are found
+            if current_a is not None and mps_v is not None and mag_v is not None and time_str:
+                break
+
     if all([current_a is not None, mps_v is not None, mag_v is not None, time_str]):
         return {
             "current_A": current_a,
@@ -191,9 +318,11 @@ def parse_mri_data(text: str) -> Optional[Dict[str, Any]]:
     return None
 
 
+@lru_cache(maxsize=4096)
 def time_string_to_seconds(time_str: str) -> float:
     """
     Convert time string (hh:mm:ss) to seconds.
+    Results are cached, as the same displayed time is parsed for many frames.
 
     Args:
         time_str: Time string in format hh:mm:ss
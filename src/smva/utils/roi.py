@@ -4,6 +4,14 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any
 
+# Use the libyaml C implementation when PyYAML was built with it
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Keys every ROI config must provide
+_REQUIRED_ROI_KEYS = frozenset(("x", "y", "w", "h"))
+_REQUIRED_VIDEO_KEYS = frozenset(("width", "height", "fps"))
+
 
 def save_roi_config(
     config_path: Path,
@@ -26,7 +34,7 @@ def save_roi_config(
     }
 
     with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False)
+        yaml.dump(config, f, Dumper=_YAML_DUMPER, default_flow_style=False)
 
 
 def load_roi_config(config_path: Path) -> Dict[str, Any]:
@@ -42,12 +50,22 @@ def load_roi_config(config_path: Path) -> Dict[str, Any]:
     if not config_path.exists():
         raise FileNotFoundError(f"ROI config not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    with open(config_path, "rb") as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
 
-    if "roi" not in config or "video" not in config:
+    if (
+        not isinstance(config, dict)
+        or not isinstance(config.get("roi"), dict)
+        or not isinstance(config.get("video"), dict)
+    ):
         raise ValueError("Invalid ROI config format")
 
+    missing = (_REQUIRED_ROI_KEYS - config["roi"].keys()) | (
+        _REQUIRED_VIDEO_KEYS - config["video"].keys()
+    )
+    if missing:
+        raise ValueError(f"Invalid ROI config format, missing keys: {', '.join(sorted(missing))}")
+
     # Add default validation settings if not present
     if "validation" not in config:
         config["validation"] = {
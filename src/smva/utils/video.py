@@ -1,8 +1,32 @@
 """Video processing utilities."""
 
 import cv2
+from collections import OrderedDict
 from pathlib import Path
-from typing import Tuple, Optional
+from typing import Dict, Tuple, Optional
+
+
+def open_video_capture(video_path: Path) -> cv2.VideoCapture:
+    """
+    Open video for decoding, using hardware accelerated decoding if available.
+    FFmpeg falls back to software decoding when no accelerator is usable;
+    if the FFmpeg backend cannot open the file, the default backend is used.
+
+    Args:
+        video_path: Path to video file
+
+    Returns:
+        Video capture object (check isOpened())
+    """
+    path_str = str(video_path)
+    cap = cv2.VideoCapture(
+        path_str,
+        cv2.CAP_FFMPEG,
+        [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY],
+    )
+    if not cap.isOpened():
+        cap = cv2.VideoCapture(path_str)
+    return cap
 
 
 def get_video_metadata(video_path: Path) -> Tuple[int, int, float, int]:
@@ -29,34 +53,53 @@ def get_video_metadata(video_path: Path) -> Tuple[int, int, float, int]:
 
 
 def extract_preview_frames(
-    video_path: Path, output_dir: Path, num_frames: int = 5
+    video_path: Path,
+    output_dir: Path,
+    num_frames: int = 5,
+    frame_count: Optional[int] = None,
 ) -> list[Path]:
     """
     Extract evenly spaced preview frames from video.
+    Targets close to the current position are reached by grabbing forward,
+    distant ones by seeking, whichever decodes fewer frames.
 
     Args:
         video_path: Path to video file
         output_dir: Directory to save preview frames
         num_frames: Number of frames to extract
+        frame_count: Total number of frames, if already known from get_video_metadata
 
     Returns:
         List of paths to saved frame images
     """
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    cap = cv2.VideoCapture(str(video_path))
+    cap = open_video_capture(video_path)
     if not cap.isOpened():
         raise ValueError(f"Could not open video: {video_path}")
 
-    frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+    if frame_count is None:
+        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
     frame_indices = [
         int(frame_count * i / (num_frames + 1)) for i in range(1, num_frames + 1)
     ]
 
+    # A seek decodes from the previous keyframe, so grabbing forward is only
+    # cheaper for gaps shorter than a typical keyframe interval (~2 seconds)
+    max_grab_gap = int((cap.get(cv2.CAP_PROP_FPS) or 30.0) * 2)
+
     saved_paths = []
+    position = 0
     for idx, frame_num in enumerate(frame_indices):
-        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
+        gap = frame_num - position
+        if gap < 0 or gap > max_grab_gap:
+            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
+        else:
+            for _ in range(gap):
+                if not cap.grab():
+                    break
         ret, frame = cap.read()
+        position = frame_num + 1
         if ret:
             output_path = output_dir / f"preview_frame_{idx + 1:02d}.jpg"
             cv2.imwrite(str(output_path), frame)
@@ -66,24 +109,87 @@ def extract_preview_frames(
     return saved_paths
 
 
-def load_frame(video_path: Path, frame_number: int) -> Optional[cv2.Mat]:
+class SequentialROIReader:
     """
-    Load a specific frame from video.
-
-    Args:
-        video_path: Path to video file
-        frame_number: Frame number to load (0-indexed)
-
-    Returns:
-        Frame image or None if failed
+    Read ROI crops of video frames by decoding forward instead of seeking.
+    Every seek restarts decoding from the previous keyframe, which is slow
+    when frames are requested in increasing order. Crops of the most recently
+    decoded frames are kept, so requests for nearby earlier frames (fallback
+    offsets) are served without seeking. Frames skipped over are only
+    grabbed, which avoids the color conversion and copy of retrieving them.
     """
-    cap = cv2.VideoCapture(str(video_path))
-    if not cap.isOpened():
-        return None
-
-    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-    ret, frame = cap.read()
-    cap.release()
-
-    return frame if ret else None
 
+    def __init__(
+        self,
+        cap: cv2.VideoCapture,
+        roi: Dict[str, int],
+        history: int = 16,
+        lookbehind: Optional[int] = None,
+        max_skip: Optional[int] = None,
+    ):
+        """
+        Initialize reader.
+
+        Args:
+            cap: Video capture object, positioned at frame 0
+            roi: ROI coordinates (x, y, w, h)
+            history: Number of most recent ROI crops to keep
+            lookbehind: Frames up to this many before a requested frame are
+                retrieved and kept, older skipped frames are only grabbed
+                (default: history)
+            max_skip: Requests more than this many frames ahead of the current
+                position seek instead of decoding forward (default: never seek forward)
+        """
+        self.cap = cap
+        self.rows = slice(roi["y"], roi["y"] + roi["h"])
+        self.cols = slice(roi["x"], roi["x"] + roi["w"])
+        self.history = history
+        self.lookbehind = history if lookbehind is None else lookbehind
+        self.max_skip = max_skip
+        self.crops: OrderedDict[int, cv2.Mat] = OrderedDict()
+        self.position = 0  # Number of the frame the next read() returns
+
+    def read(self, frame_num: int) -> Optional[cv2.Mat]:
+        """
+        Get the ROI crop of a frame.
+
+        Args:
+            frame_num: Frame number (0-indexed)
+
+        Returns:
+            ROI image or None if the frame could not be read
+        """
+        crop = self.crops.get(frame_num)
+        if crop is not None:
+            return crop
+
+        if frame_num < self.position:
+            # Older than the kept crops, seeking cannot be avoided
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
+            self.position = frame_num
+        elif self.max_skip is not None and frame_num - self.position > self.max_skip:
+            # Far ahead, decoding from the previous keyframe is cheaper;
+            # start at the first frame that would be retrieved anyway
+            self.position = max(frame_num - self.lookbehind, 0)
+            self.cap.set(cv2.CAP_PROP_POS_FRAMES, self.position)
+
+        while self.position <= frame_num:
+            if self.position < frame_num - self.lookbehind:
+                # Not expected to be requested, advance without retrieving the image
+                if not self.cap.grab():
+                    return None
+                self.position += 1
+                continue
+
+            ret, frame = self.cap.read()
+            if not ret:
+                return None
+
+            # Copy so the full frame is not kept alive by the crop
+            self.crops[self.position] = frame[self.rows, self.cols].copy()
+            self.crops.move_to_end(self.position)
+            if len(self.crops) > self.history:
+                self.crops.popitem(last=False)
+            self.position += 1
+
+        return self.crops[frame_num]
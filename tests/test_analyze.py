@@ -0,0 +1,125 @@
+"""Tests for loading cleaned data in the analyze module."""
+
+import json
+import os
+
+import numpy as np
+import pytest
+
+from smva import analyze
+
+
+def write_cleaned(path, times, fps=30.0):
+    data = {
+        "video": "test.mp4",
+        "fps": fps,
+        "data": [
+            {"time_sec": int(t), "time_sec_precise": t, "current_A": t * 2, "mps_V": 1.5, "mag_V": -t}
+            for t in times
+        ],
+    }
+    path.write_text(json.dumps(data))
+    return data
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(analyze, "_CACHE", {})
+
+
+def test_sidecar_round_trip(tmp_path):
+    cleaned = tmp_path / "output_cleaned.json"
+    write_cleaned(cleaned, [0.0, 0.5, 1.0])
+
+    first = analyze.load_cleaned_data(cleaned)
+    sidecar = cleaned.with_suffix(".npz")
+    assert sidecar.exists()
+    assert "data" in first
+
+    analyze._CACHE.clear()
+    second = analyze.load_cleaned_data(cleaned)
+    assert "data" not in second
+    assert second["video"] == "test.mp4"
+    assert second["fps"] == 30.0
+    np.testing.assert_array_equal(second["_series"], first["_series"])
+
+
+def test_sidecar_is_ignored_after_json_changes(tmp_path):
+    cleaned = tmp_path / "output_cleaned.json"
+    write_cleaned(cleaned, [0.0, 0.5, 1.0])
+    analyze.load_cleaned_data(cleaned)
+
+    analyze._CACHE.clear()
+    write_cleaned(cleaned, [0.0, 0.5, 1.0, 1.5])
+    data = analyze.load_cleaned_data(cleaned)
+    assert len(data["_series"]) == 4
+
+
+def test_sidecar_source_mismatch(tmp_path):
+    cleaned = tmp_path / "output_cleaned.json"
+    write_cleaned(cleaned, [0.0, 0.5])
+    analyze.load_cleaned_data(cleaned)
+    sidecar = cleaned.with_suffix(".npz")
+
+    stat = cleaned.stat()
+    assert analyze.load_series_sidecar(sidecar, (stat.st_mtime_ns, stat.st_size)) is not None
+    assert analyze.load_series_sidecar(sidecar, (stat.st_mtime_ns + 1, stat.st_size)) is None
+    assert analyze.load_series_sidecar(sidecar, (stat.st_mtime_ns, stat.st_size + 1)) is None
+
+    # Same size, newer mtime: the JSON is parsed again
+    os.utime(cleaned, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert "data" in analyze.load_cleaned_data(cleaned)
+
+
+@pytest.mark.parametrize("content", [b"", b"not a zip file", b"PK\x03\x04truncated"])
+def test_corrupt_sidecar_falls_back_to_json(tmp_path, content):
+    cleaned = tmp_path / "output_cleaned.json"
+    write_cleaned(cleaned, [0.0, 0.5, 1.0])
+    sidecar = cleaned.with_suffix(".npz")
+    sidecar.write_bytes(content)
+
+    data = analyze.load_cleaned_data(cleaned)
+    assert "data" in data
+    assert len(data["_series"]) == 3
+
+    # The sidecar was rewritten and is usable again
+    stat = cleaned.stat()
+    assert analyze.load_series_sidecar(sidecar, (stat.st_mtime_ns, stat.st_size)) is not None
+
+
+def test_truncated_sidecar_falls_back_to_json(tmp_path):
+    cleaned = tmp_path / "output_cleaned.json"
+    write_cleaned(cleaned, [0.0, 0.5, 1.0])
+    analyze.load_cleaned_data(cleaned)
+    sidecar = cleaned.with_suffix(".npz")
+    sidecar.write_bytes(sidecar.read_bytes()[:100])
+
+    analyze._CACHE.clear()
+    assert "data" in analyze.load_cleaned_data(cleaned)
+
+
+def test_build_series_array_columns():
+    points = [
+        {"time_sec": 1, "time_sec_precise": 1.25, "current_A": 10.0, "mps_V": 1.0, "mag_V": -1.0},
+        {"time_sec": 2, "current_A": 20.0, "mps_V": 2.0, "mag_V": -2.0},
+    ]
+    series = analyze.build_series_array(points)
+    assert series.dtype == np.float32
+    np.testing.assert_array_equal(
+        series, np.array([[1.25, 10.0, 1.0, -1.0], [2.0, 20.0, 2.0, -2.0]], dtype=np.float32)
+    )
+
+
+def test_build_series_array_sorts_by_time():
+    points = [
+        {"time_sec": t, "current_A": float(i), "mps_V": 0.0, "mag_V": 0.0}
+        for i, t in enumerate([0, 2, 1, 2, 3])
+    ]
+    series = analyze.build_series_array(points)
+    np.testing.assert_array_equal(series[:, 0], [0, 1, 2, 2, 3])
+    # Equal times keep their original order
+    np.testing.assert_array_equal(series[:, 1], [0, 2, 1, 3, 4])
+
+
+def test_build_series_array_empty():
+    assert analyze.build_series_array([]).shape == (0, 4)
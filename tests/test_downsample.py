@@ -0,0 +1,89 @@
+"""Tests for the plot downsampling helpers."""
+
+import numpy as np
+import pytest
+
+from smva.utils import downsample
+from smva.utils.downsample import lttb_indices, minmax_lttb_indices, minmax_lttb_union_indices
+
+
+def make_signal(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.arange(n, dtype=np.float64) * 0.1
+    y = np.cumsum(rng.normal(size=n))
+    return x, y
+
+
+def assert_valid_indices(indices, n):
+    assert np.all(np.diff(indices) > 0)
+    assert indices[0] == 0
+    assert indices[-1] == n - 1
+
+
+@pytest.mark.parametrize("n, n_out", [(10_000, 500), (1_001, 3), (5_000, 4_999)])
+def test_lttb_indices_keeps_endpoints_and_budget(n, n_out):
+    x, y = make_signal(n)
+    indices = lttb_indices(x, y, n_out)
+    assert len(indices) == n_out
+    assert_valid_indices(indices, n)
+
+
+def test_lttb_indices_small_input_is_unchanged():
+    x, y = make_signal(100)
+    np.testing.assert_array_equal(lttb_indices(x, y, 200), np.arange(100))
+    np.testing.assert_array_equal(lttb_indices(x, y, 2), np.arange(100))
+
+
+def test_lttb_indices_keeps_spike():
+    x, y = make_signal(10_000)
+    y[4321] = 1e6
+    assert 4321 in lttb_indices(x, y, 300)
+
+
+@pytest.fixture(params=["tsdownsample", "numpy"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        monkeypatch.setattr(downsample, "MinMaxLTTBDownsampler", None)
+    elif downsample.MinMaxLTTBDownsampler is None:
+        pytest.skip("tsdownsample is not installed")
+    return request.param
+
+
+@pytest.mark.parametrize("n, n_out", [(100_000, 1200), (10_000, 3)])
+def test_minmax_lttb_indices_keeps_endpoints_and_budget(backend, n, n_out):
+    x, y = make_signal(n)
+    indices = minmax_lttb_indices(x, y, n_out)
+    assert len(indices) <= n_out
+    assert_valid_indices(indices, n)
+
+
+def test_minmax_lttb_indices_keeps_spike(backend):
+    x, y = make_signal(100_000)
+    y[54_321] = -1e6
+    assert 54_321 in minmax_lttb_indices(x, y, 1200)
+
+
+def test_minmax_lttb_indices_small_input_is_unchanged(backend):
+    x, y = make_signal(500)
+    np.testing.assert_array_equal(minmax_lttb_indices(x, y, 1200), np.arange(500))
+
+
+@pytest.mark.parametrize("n_out", [9, 300, 1200])
+def test_union_indices_respects_total_budget(backend, n_out):
+    n = 50_000
+    x, _ = make_signal(n)
+    series = [make_signal(n, seed)[1] for seed in range(3)]
+    indices = minmax_lttb_union_indices(x, series, n_out)
+    assert len(indices) <= n_out
+    assert_valid_indices(indices, n)
+
+
+def test_union_indices_keeps_spike_of_every_series(backend):
+    n = 50_000
+    x, _ = make_signal(n)
+    series = [make_signal(n, seed)[1] for seed in range(3)]
+    spikes = (1234, 25_000, 48_765)
+    for y, i in zip(series, spikes):
+        y[i] = 1e6
+    indices = minmax_lttb_union_indices(x, series, 1200)
+    assert set(spikes) <= set(indices.tolist())
@@ -0,0 +1,59 @@
+"""Tests for the outlier filters of plot_graphs."""
+
+import json
+
+import matplotlib
+
+matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import pytest
+
+from smva.plot import plot_graphs
+
+
+def point(t, current=100.0, mps=1.0, mag=1.0):
+    return {"time_sec": t, "current_A": current, "mps_V": mps, "mag_V": mag}
+
+
+def cleaned_times(tmp_path, points):
+    plot_graphs({"video": "test.mp4", "data": points}, tmp_path / "graph.png")
+    cleaned = json.loads((tmp_path / "output_cleaned.json").read_text())
+    return [item["time_sec"] for item in cleaned["data"]]
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    yield
+    plt.close("all")
+
+
+def test_clean_data_is_kept(tmp_path):
+    points = [point(t, current=100.0 + t) for t in range(10)]
+    assert cleaned_times(tmp_path, points) == list(range(10))
+
+
+def test_out_of_range_points_are_removed(tmp_path):
+    points = [point(t) for t in range(10)]
+    points[3] = point(3, current=700.0)
+    points[6] = point(6, mag=-20.0)
+    assert cleaned_times(tmp_path, points) == [0, 1, 2, 4, 5, 7, 8, 9]
+
+
+def test_isolated_spike_is_removed(tmp_path):
+    # A 10 s step keeps the spike under the rate limit, so only the
+    # isolated outlier filter catches it
+    points = [point(t * 10, current=100.0) for t in range(10)]
+    points[4] = point(40, current=400.0)
+    assert 40 not in cleaned_times(tmp_path, points)
+
+
+def test_time_jump_is_removed(tmp_path):
+    points = [point(t) for t in range(10)]
+    points[5] = point(5000)
+    assert 5000 not in cleaned_times(tmp_path, points)
+
+
+def test_all_invalid_raises(tmp_path):
+    with pytest.raises(ValueError, match="No valid data points"):
+        plot_graphs({"data": [point(0, current=1000.0)]}, tmp_path / "graph.png")
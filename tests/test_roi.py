@@ -0,0 +1,49 @@
+"""Tests for ROI config loading."""
+
+import pytest
+
+from smva.utils.roi import load_roi_config
+
+VALID = """
+roi: {x: 10, y: 20, w: 300, h: 120}
+video: {width: 1920, height: 1080, fps: 30.0}
+"""
+
+
+def write_config(tmp_path, text):
+    path = tmp_path / "roi.yaml"
+    path.write_text(text)
+    return path
+
+
+def test_valid_config_gets_default_validation(tmp_path):
+    config = load_roi_config(write_config(tmp_path, VALID))
+    assert config["roi"] == {"x": 10, "y": 20, "w": 300, "h": 120}
+    assert config["video"]["fps"] == 30.0
+    assert config["validation"]["current_max"] == 600
+
+
+def test_missing_file(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_roi_config(tmp_path / "missing.yaml")
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "- roi\n- video\n",
+        "roi: {x: 1, y: 1, w: 1, h: 1}\n",
+        "roi: 5\nvideo: {width: 1, height: 1, fps: 1}\n",
+        "roi: {x: 1, y: 1, w: 1, h: 1}\nvideo: [1920, 1080, 30]\n",
+    ],
+)
+def test_invalid_format(tmp_path, text):
+    with pytest.raises(ValueError, match="Invalid ROI config format"):
+        load_roi_config(write_config(tmp_path, text))
+
+
+def test_missing_keys_are_listed(tmp_path):
+    text = "roi: {x: 1, y: 1}\nvideo: {width: 1, height: 1}\n"
+    with pytest.raises(ValueError, match="missing keys: fps, h, w"):
+        load_roi_config(write_config(tmp_path, text))
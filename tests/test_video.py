@@ -0,0 +1,79 @@
+"""Tests for the sequential ROI reader."""
+
+import cv2
+import numpy as np
+import pytest
+
+from smva.utils.video import SequentialROIReader
+
+N_FRAMES = 40
+ROI = {"x": 8, "y": 16, "w": 48, "h": 24}
+
+
+@pytest.fixture(scope="module")
+def video_path(tmp_path_factory):
+    path = tmp_path_factory.mktemp("video") / "frames.avi"
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"MJPG"), 10.0, (64, 48))
+    if not writer.isOpened():
+        pytest.skip("MJPG video writer is not available")
+    rng = np.random.default_rng(0)
+    for i in range(N_FRAMES):
+        frame = rng.integers(0, 256, size=(48, 64, 3), dtype=np.uint8)
+        cv2.putText(frame, str(i), (10, 35), cv2.FONT_HERSHEY_SIMPLEX, 0.8, (255, 255, 255), 2)
+        writer.write(frame)
+    writer.release()
+    return path
+
+
+def seek_and_read(video_path, frame_num):
+    cap = cv2.VideoCapture(str(video_path))
+    try:
+        cap.set(cv2.CAP_PROP_POS_FRAMES, frame_num)
+        ret, frame = cap.read()
+    finally:
+        cap.release()
+    if not ret:
+        return None
+    return frame[ROI["y"] : ROI["y"] + ROI["h"], ROI["x"] : ROI["x"] + ROI["w"]]
+
+
+def make_reader(video_path, **kwargs):
+    return SequentialROIReader(cv2.VideoCapture(str(video_path)), ROI, **kwargs)
+
+
+def assert_reads_match(reader, video_path, frame_nums):
+    for frame_num in frame_nums:
+        crop = reader.read(frame_num)
+        assert crop is not None, frame_num
+        np.testing.assert_array_equal(crop, seek_and_read(video_path, frame_num), err_msg=str(frame_num))
+
+
+def test_forward_reads_match_seeking(video_path):
+    reader = make_reader(video_path, history=3, lookbehind=1)
+    assert_reads_match(reader, video_path, [0, 1, 5, 6, 4, 12, 11, 13, 30])
+
+
+def test_backward_reads_seek(video_path):
+    reader = make_reader(video_path, history=2, lookbehind=0)
+    assert_reads_match(reader, video_path, [20, 25, 3, 2, 10, 0])
+
+
+def test_far_forward_reads_seek(video_path):
+    reader = make_reader(video_path, history=5, lookbehind=2, max_skip=4)
+    assert_reads_match(reader, video_path, [0, 20, 19, 18, 35, 33, 21])
+
+
+def test_crops_are_kept_and_not_views(video_path):
+    reader = make_reader(video_path, history=4, lookbehind=3)
+    crop = reader.read(10)
+    assert crop.base is None
+    assert reader.read(10) is crop
+    assert sorted(reader.crops) == [7, 8, 9, 10]
+
+
+def test_end_of_stream(video_path):
+    reader = make_reader(video_path, history=3)
+    assert reader.read(N_FRAMES) is None
+    assert reader.read(N_FRAMES + 5) is None
+    # The reader still seeks back after running off the end
+    assert_reads_match(reader, video_path, [N_FRAMES - 1, 0])